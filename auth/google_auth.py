@@ -1,10 +1,15 @@
 # auth/google_auth.py
 
 import asyncio
+import hashlib
 import json
 import jwt
 import logging
 import os
+import threading
+import time
+
+from collections import OrderedDict
 
 from typing import List, Optional, Tuple, Dict, Any
 from urllib.parse import parse_qs, urlparse
@@ -13,8 +18,10 @@ from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
 from google.auth.transport.requests import Request
 from google.auth.exceptions import RefreshError
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
 from auth.scopes import SCOPES, get_current_scopes  # noqa
 from auth.oauth21_session_store import get_oauth21_session_store
 from auth.credential_store import get_credential_store
@@ -750,6 +757,131 @@ def get_user_info(credentials: Credentials) -> Optional[Dict[str, Any]]:
             service.close()
 
 
+# --- Service Client Cache ---
+
+# Built service clients keyed by (service, version, scopes, user, token digest).
+# Building a client parses the discovery document and constructs a large
+# object graph, so repeated tool calls for the same user reuse the client.
+_SERVICE_CACHE: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+_SERVICE_CACHE_TTL = 300
+_SERVICE_CACHE_MAX_SIZE = 256
+
+
+def _service_cache_key(
+    service_name: str,
+    version: str,
+    credentials: Credentials,
+    required_scopes: List[str],
+    user_email: Optional[str],
+) -> Optional[tuple]:
+    """Build the cache key for a service client, or None if uncacheable.
+
+    The key includes the exact required scope set so a client built for a
+    broader request is never handed to a narrower one, and a digest of the
+    access token so refreshed or different credentials always miss.
+    """
+    token = getattr(credentials, "token", None)
+    if not token:
+        return None
+    token_digest = hashlib.sha256(token.encode("utf-8")).hexdigest()
+    return (
+        service_name,
+        version,
+        frozenset(required_scopes),
+        user_email,
+        token_digest,
+    )
+
+
+_THREAD_HTTP = threading.local()
+
+
+def _thread_http() -> Any:
+    """Return the calling thread's keep-alive Http, creating it on first use."""
+    http = getattr(_THREAD_HTTP, "http", None)
+    if http is None:
+        http = _THREAD_HTTP.http = build_http()
+        logger.debug(
+            "Created keep-alive Http for thread %s", threading.current_thread().name
+        )
+    return http
+
+
+class _ThreadHttpRequest(HttpRequest):
+    """HttpRequest that executes on the calling thread's pooled Http.
+
+    Tool calls execute requests on executor worker threads, and each thread
+    keeps one ``build_http()`` connection pool, so consecutive requests on a
+    thread reuse open TLS connections instead of handshaking every time.
+    ``self.http`` stays a per-request Http for media downloads and uploads,
+    which drive it directly.
+    """
+
+    def execute(self, http=None, num_retries=0):
+        if http is None:
+            http = AuthorizedHttp(self.http.credentials, http=_thread_http())
+        return super().execute(http=http, num_retries=num_retries)
+
+
+def _build_service(service_name: str, version: str, credentials: Credentials) -> Any:
+    """Build a service client that is safe to share across threads.
+
+    httplib2 connections are not thread-safe and tool calls execute requests
+    on worker threads, so every request gets its own authorized Http and
+    ``execute`` sends on a pool owned by the executing thread.  Both come
+    from ``build_http``, keeping the client library's default timeout and
+    its handling of the 308s used by resumable uploads.
+    """
+
+    def _request_builder(http, *args, **kwargs):
+        return _ThreadHttpRequest(
+            AuthorizedHttp(credentials, http=build_http()), *args, **kwargs
+        )
+
+    return build(
+        service_name,
+        version,
+        http=AuthorizedHttp(credentials, http=build_http()),
+        requestBuilder=_request_builder,
+        static_discovery=True,
+    )
+
+
+def build_cached_service(
+    service_name: str,
+    version: str,
+    credentials: Credentials,
+    required_scopes: List[str],
+    user_email: Optional[str] = None,
+) -> Any:
+    """Return a cached service client for these credentials, building it if needed."""
+    cache_key = _service_cache_key(
+        service_name, version, credentials, required_scopes, user_email
+    )
+    if cache_key is None:
+        return _build_service(service_name, version, credentials)
+
+    now = time.monotonic()
+    cached = _SERVICE_CACHE.get(cache_key)
+    if cached is not None:
+        built_at, service = cached
+        if now - built_at < _SERVICE_CACHE_TTL:
+            _SERVICE_CACHE.move_to_end(cache_key)
+            return service
+        del _SERVICE_CACHE[cache_key]
+
+    service = _build_service(service_name, version, credentials)
+    _SERVICE_CACHE[cache_key] = (now, service)
+    if len(_SERVICE_CACHE) > _SERVICE_CACHE_MAX_SIZE:
+        _SERVICE_CACHE.popitem(last=False)
+    return service
+
+
+def clear_service_cache() -> None:
+    """Drop all cached service clients."""
+    _SERVICE_CACHE.clear()
+
+
 # --- Centralized Google Service Authentication ---
 
 
@@ -867,7 +999,9 @@ async def get_authenticated_google_service(
         raise GoogleAuthenticationError(auth_response)
 
     try:
-        service = build(service_name, version, credentials=credentials)
+        service = build_cached_service(
+            service_name, version, credentials, required_scopes
+        )
         log_user_email = None
 
         # Try to get email from credentials for logging
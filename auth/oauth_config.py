@@ -359,6 +359,9 @@ class OAuthConfig:
 # Global configuration instance
 _oauth_config = None
 
+# OAuth 2.1 flag of the current instance, read on every tool call
+_oauth21_enabled: Optional[bool] = None
+
 
 def get_oauth_config() -> OAuthConfig:
     """
@@ -382,8 +385,9 @@ def reload_oauth_config() -> OAuthConfig:
     Returns:
         The reloaded OAuth configuration instance
     """
-    global _oauth_config
+    global _oauth_config, _oauth21_enabled
     _oauth_config = OAuthConfig()
+    _oauth21_enabled = None
     return _oauth_config
 
 
@@ -419,8 +423,11 @@ def get_transport_mode() -> str:
 
 
 def is_oauth21_enabled() -> bool:
-    """Check if OAuth 2.1 is enabled."""
-    return get_oauth_config().is_oauth21_enabled()
+    """Check if OAuth 2.1 is enabled (cached until the config is reloaded)."""
+    global _oauth21_enabled
+    if _oauth21_enabled is None:
+        _oauth21_enabled = get_oauth_config().is_oauth21_enabled()
+    return _oauth21_enabled
 
 
 def get_oauth_redirect_uri() -> str:
@@ -1,13 +1,20 @@
+import asyncio
 import inspect
 import logging
+import os
 
-from functools import wraps
-from typing import Dict, List, Optional, Any, Callable, Union, Tuple
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Optional, Any, Callable, Union, Tuple
 
 from google.auth.exceptions import RefreshError
-from googleapiclient.discovery import build
+from googleapiclient.http import BatchHttpRequest
 from fastmcp.server.dependencies import get_access_token, get_context
-from auth.google_auth import get_authenticated_google_service, GoogleAuthenticationError
+from auth.google_auth import (
+    build_cached_service,
+    get_authenticated_google_service,
+    GoogleAuthenticationError,
+)
 from auth.oauth21_session_store import (
     get_auth_provider,
     get_oauth21_session_store,
@@ -77,13 +84,17 @@ def _get_auth_context(
         if mcp_session_id:
             set_fastmcp_session_id(mcp_session_id)
 
-        logger.info(
-            f"[{tool_name}] Auth from middleware: authenticated_user={authenticated_user}, auth_method={auth_method}, session_id={mcp_session_id}"
+        logger.debug(
+            "[%s] Auth from middleware: authenticated_user=%s, auth_method=%s, session_id=%s",
+            tool_name,
+            authenticated_user,
+            auth_method,
+            mcp_session_id,
         )
         return authenticated_user, auth_method, mcp_session_id
 
     except Exception as e:
-        logger.debug(f"[{tool_name}] Could not get FastMCP context: {e}")
+        logger.debug("[%s] Could not get FastMCP context: %s", tool_name, e)
         return None, None, None
 
 
@@ -101,8 +112,10 @@ def _detect_oauth_version(
 
     # When OAuth 2.1 is enabled globally, ALWAYS use OAuth 2.1 for authenticated users
     if authenticated_user:
-        logger.info(
-            f"[{tool_name}] OAuth 2.1 mode: Using OAuth 2.1 for authenticated user '{authenticated_user}'"
+        logger.debug(
+            "[%s] OAuth 2.1 mode: Using OAuth 2.1 for authenticated user '%s'",
+            tool_name,
+            authenticated_user,
         )
         return True
 
@@ -110,25 +123,25 @@ def _detect_oauth_version(
     # be available even if middleware state wasn't populated.
     try:
         if get_access_token() is not None:
-            logger.info(
-                f"[{tool_name}] OAuth 2.1 mode: Using OAuth 2.1 based on validated access token"
+            logger.debug(
+                "[%s] OAuth 2.1 mode: Using OAuth 2.1 based on validated access token",
+                tool_name,
             )
             return True
     except Exception as e:
         logger.debug(
-            f"[{tool_name}] Could not inspect access token for OAuth mode: {e}"
+            "[%s] Could not inspect access token for OAuth mode: %s", tool_name, e
         )
 
     # Only use version detection for unauthenticated requests
-    config = get_oauth_config()
-    request_params = {}
-    if mcp_session_id:
-        request_params["session_id"] = mcp_session_id
-
-    oauth_version = config.detect_oauth_version(request_params)
+    request_params = {"session_id": mcp_session_id} if mcp_session_id else {}
+    oauth_version = get_oauth_config().detect_oauth_version(request_params)
     use_oauth21 = oauth_version == "oauth21"
-    logger.info(
-        f"[{tool_name}] OAuth version detected: {oauth_version}, will use OAuth 2.1: {use_oauth21}"
+    logger.debug(
+        "[%s] OAuth version detected: %s, will use OAuth 2.1: %s",
+        tool_name,
+        oauth_version,
+        use_oauth21,
     )
     return use_oauth21
 
@@ -139,17 +152,21 @@ async def _authenticate_service(
     service_version: str,
     tool_name: str,
     resolved_scopes: List[str],
+    resolved_scope_set: FrozenSet[str],
     mcp_session_id: Optional[str],
     authenticated_user: Optional[str],
 ) -> Tuple[Any, str]:
     """
     Authenticate and get Google service using appropriate OAuth version.
 
+    ``resolved_scope_set`` is ``resolved_scopes`` as a frozenset, built once
+    by the decorator for the OAuth 2.1 scope check.
+
     Returns:
         Tuple of (service, actual_user_email)
     """
     if use_oauth21:
-        logger.debug(f"[{tool_name}] Using OAuth 2.1 flow")
+        logger.debug("[%s] Using OAuth 2.1 flow", tool_name)
         return await get_authenticated_google_service_oauth21(
             service_name=service_name,
             version=service_version,
@@ -158,9 +175,10 @@ async def _authenticate_service(
             session_id=mcp_session_id,
             auth_token_email=authenticated_user,
             allow_recent_auth=False,
+            required_scopes_set=resolved_scope_set,
         )
     else:
-        logger.debug(f"[{tool_name}] Using legacy OAuth 2.0 flow")
+        logger.debug("[%s] Using legacy OAuth 2.0 flow", tool_name)
         return await get_authenticated_google_service(
             service_name=service_name,
             version=service_version,
@@ -178,10 +196,16 @@ async def get_authenticated_google_service_oauth21(
     session_id: Optional[str] = None,
     auth_token_email: Optional[str] = None,
     allow_recent_auth: bool = False,
+    required_scopes_set: Optional[FrozenSet[str]] = None,
 ) -> tuple[Any, str]:
     """
     OAuth 2.1 authentication using the session store with security validation.
+
+    Decorators pass ``required_scopes_set`` precomputed; other callers may
+    omit it.
     """
+    if required_scopes_set is None:
+        required_scopes_set = frozenset(required_scopes)
     provider = get_auth_provider()
     access_token = get_access_token()
 
@@ -213,13 +237,17 @@ async def get_authenticated_google_service_oauth21(
         if not scopes_available and getattr(access_token, "scopes", None):
             scopes_available = set(access_token.scopes)
 
-        if not all(scope in scopes_available for scope in required_scopes):
+        if not required_scopes_set.issubset(scopes_available):
             raise GoogleAuthenticationError(
                 f"OAuth credentials lack required scopes. Need: {required_scopes}, Have: {sorted(scopes_available)}"
             )
 
-        service = build(service_name, version, credentials=credentials)
-        logger.info(f"[{tool_name}] Authenticated {service_name} for {resolved_email}")
+        service = build_cached_service(
+            service_name, version, credentials, required_scopes, resolved_email
+        )
+        logger.info(
+            "[%s] Authenticated %s for %s", tool_name, service_name, resolved_email
+        )
         return service, resolved_email
 
     store = get_oauth21_session_store()
@@ -248,104 +276,165 @@ async def get_authenticated_google_service_oauth21(
     else:
         scopes_available = set(credentials.scopes)
 
-    if not all(scope in scopes_available for scope in required_scopes):
+    if not required_scopes_set.issubset(scopes_available):
         raise GoogleAuthenticationError(
             f"OAuth 2.1 credentials lack required scopes. Need: {required_scopes}, Have: {sorted(scopes_available)}"
         )
 
-    service = build(service_name, version, credentials=credentials)
-    logger.info(f"[{tool_name}] Authenticated {service_name} for {auth_token_email}")
+    service = build_cached_service(
+        service_name, version, credentials, required_scopes, auth_token_email
+    )
+    logger.info(
+        "[%s] Authenticated %s for %s", tool_name, service_name, auth_token_email
+    )
 
     return service, auth_token_email
 
 
-# Service configuration mapping
-SERVICE_CONFIGS = {
-    "gmail": {"service": "gmail", "version": "v1"},
-    "drive": {"service": "drive", "version": "v3"},
-    "calendar": {"service": "calendar", "version": "v3"},
-    "docs": {"service": "docs", "version": "v1"},
-    "sheets": {"service": "sheets", "version": "v4"},
-    "chat": {"service": "chat", "version": "v1"},
-    "forms": {"service": "forms", "version": "v1"},
-    "slides": {"service": "slides", "version": "v1"},
-    "tasks": {"service": "tasks", "version": "v1"},
-    "people": {"service": "people", "version": "v1"},
-    "customsearch": {"service": "customsearch", "version": "v1"},
-    "script": {"service": "script", "version": "v1"},
-}
+def create_batch(service: Any, callback: Optional[Callable] = None) -> BatchHttpRequest:
+    """
+    Create a batch request for an injected Google service.
+
+    Lets a tool send several calls to the same API in one HTTP round-trip
+    instead of executing them one by one. Batches cannot mix APIs, so a tool
+    using require_multiple_services needs one batch per service.
+
+    Args:
+        service: An authenticated service injected by the decorators
+        callback: Optional ``callback(request_id, response, exception)`` run
+            for each request in the batch
+
+    Usage:
+        batch = create_batch(drive_service, callback=_on_file)
+        for file_id in file_ids:
+            batch.add(drive_service.files().get(fileId=file_id), request_id=file_id)
+        await asyncio.to_thread(batch.execute)
+    """
+    return service.new_batch_http_request(callback=callback)
+
+
+# Service configuration mapping: service type -> (API name, default version)
+SERVICE_CONFIGS = MappingProxyType(
+    {
+        "gmail": ("gmail", "v1"),
+        "drive": ("drive", "v3"),
+        "calendar": ("calendar", "v3"),
+        "docs": ("docs", "v1"),
+        "sheets": ("sheets", "v4"),
+        "chat": ("chat", "v1"),
+        "forms": ("forms", "v1"),
+        "slides": ("slides", "v1"),
+        "tasks": ("tasks", "v1"),
+        "people": ("people", "v1"),
+        "customsearch": ("customsearch", "v1"),
+        "script": ("script", "v1"),
+    }
+)
 
 
 # Scope group definitions for easy reference
-SCOPE_GROUPS = {
-    # Gmail scopes
-    "gmail_read": GMAIL_READONLY_SCOPE,
-    "gmail_send": GMAIL_SEND_SCOPE,
-    "gmail_compose": GMAIL_COMPOSE_SCOPE,
-    "gmail_modify": GMAIL_MODIFY_SCOPE,
-    "gmail_labels": GMAIL_LABELS_SCOPE,
-    "gmail_settings_basic": GMAIL_SETTINGS_BASIC_SCOPE,
-    # Drive scopes
-    "drive_read": DRIVE_READONLY_SCOPE,
-    "drive_file": DRIVE_FILE_SCOPE,
-    # Docs scopes
-    "docs_read": DOCS_READONLY_SCOPE,
-    "docs_write": DOCS_WRITE_SCOPE,
-    # Calendar scopes
-    "calendar_read": CALENDAR_READONLY_SCOPE,
-    "calendar_events": CALENDAR_EVENTS_SCOPE,
-    # Sheets scopes
-    "sheets_read": SHEETS_READONLY_SCOPE,
-    "sheets_write": SHEETS_WRITE_SCOPE,
-    # Chat scopes
-    "chat_read": CHAT_READONLY_SCOPE,
-    "chat_write": CHAT_WRITE_SCOPE,
-    "chat_spaces": CHAT_SPACES_SCOPE,
-    # Forms scopes
-    "forms": FORMS_BODY_SCOPE,
-    "forms_read": FORMS_BODY_READONLY_SCOPE,
-    "forms_responses_read": FORMS_RESPONSES_READONLY_SCOPE,
-    # Slides scopes
-    "slides": SLIDES_SCOPE,
-    "slides_read": SLIDES_READONLY_SCOPE,
-    # Tasks scopes
-    "tasks": TASKS_SCOPE,
-    "tasks_read": TASKS_READONLY_SCOPE,
-    # Contacts scopes
-    "contacts": CONTACTS_SCOPE,
-    "contacts_read": CONTACTS_READONLY_SCOPE,
-    # Custom Search scope
-    "customsearch": CUSTOM_SEARCH_SCOPE,
-    # Apps Script scopes
-    "script_readonly": SCRIPT_PROJECTS_READONLY_SCOPE,
-    "script_projects": SCRIPT_PROJECTS_SCOPE,
-    "script_deployments": SCRIPT_DEPLOYMENTS_SCOPE,
-    "script_deployments_readonly": SCRIPT_DEPLOYMENTS_READONLY_SCOPE,
-}
+SCOPE_GROUPS = MappingProxyType(
+    {
+        # Gmail scopes
+        "gmail_read": GMAIL_READONLY_SCOPE,
+        "gmail_send": GMAIL_SEND_SCOPE,
+        "gmail_compose": GMAIL_COMPOSE_SCOPE,
+        "gmail_modify": GMAIL_MODIFY_SCOPE,
+        "gmail_labels": GMAIL_LABELS_SCOPE,
+        "gmail_settings_basic": GMAIL_SETTINGS_BASIC_SCOPE,
+        # Drive scopes
+        "drive_read": DRIVE_READONLY_SCOPE,
+        "drive_file": DRIVE_FILE_SCOPE,
+        # Docs scopes
+        "docs_read": DOCS_READONLY_SCOPE,
+        "docs_write": DOCS_WRITE_SCOPE,
+        # Calendar scopes
+        "calendar_read": CALENDAR_READONLY_SCOPE,
+        "calendar_events": CALENDAR_EVENTS_SCOPE,
+        # Sheets scopes
+        "sheets_read": SHEETS_READONLY_SCOPE,
+        "sheets_write": SHEETS_WRITE_SCOPE,
+        # Chat scopes
+        "chat_read": CHAT_READONLY_SCOPE,
+        "chat_write": CHAT_WRITE_SCOPE,
+        "chat_spaces": CHAT_SPACES_SCOPE,
+        # Forms scopes
+        "forms": FORMS_BODY_SCOPE,
+        "forms_read": FORMS_BODY_READONLY_SCOPE,
+        "forms_responses_read": FORMS_RESPONSES_READONLY_SCOPE,
+        # Slides scopes
+        "slides": SLIDES_SCOPE,
+        "slides_read": SLIDES_READONLY_SCOPE,
+        # Tasks scopes
+        "tasks": TASKS_SCOPE,
+        "tasks_read": TASKS_READONLY_SCOPE,
+        # Contacts scopes
+        "contacts": CONTACTS_SCOPE,
+        "contacts_read": CONTACTS_READONLY_SCOPE,
+        # Custom Search scope
+        "customsearch": CUSTOM_SEARCH_SCOPE,
+        # Apps Script scopes
+        "script_readonly": SCRIPT_PROJECTS_READONLY_SCOPE,
+        "script_projects": SCRIPT_PROJECTS_SCOPE,
+        "script_deployments": SCRIPT_DEPLOYMENTS_SCOPE,
+        "script_deployments_readonly": SCRIPT_DEPLOYMENTS_READONLY_SCOPE,
+    }
+)
+
+
+@lru_cache(maxsize=512)
+def _resolve_scopes_cached(scopes: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Resolve a hashable scope spec to scope URLs, memoized per spec."""
+    return tuple(SCOPE_GROUPS.get(scope, scope) for scope in scopes)
 
 
 def _resolve_scopes(scopes: Union[str, List[str]]) -> List[str]:
     """Resolve scope names to actual scope URLs."""
     if isinstance(scopes, str):
-        if scopes in SCOPE_GROUPS:
-            return [SCOPE_GROUPS[scopes]]
-        else:
-            return [scopes]
+        scopes = (scopes,)
+    return list(_resolve_scopes_cached(tuple(scopes)))
 
-    resolved = []
-    for scope in scopes:
-        if scope in SCOPE_GROUPS:
-            resolved.append(SCOPE_GROUPS[scope])
-        else:
-            resolved.append(scope)
-    return resolved
 
+class GoogleServiceAuthError(Exception):
+    """Raised when a tool is called without an authenticated user."""
 
-def _handle_token_refresh_error(
+    def __init__(self, tool_name: str):
+        super().__init__(tool_name)
+        self.tool_name = tool_name
+
+    def __str__(self) -> str:
+        return f"Authentication required for {self.tool_name}, but no authenticated user was found."
+
+
+class TokenRefreshRequired(Exception):
+    """
+    Raised when a tool's Google credentials can no longer be refreshed.
+
+    The user-facing reauthentication instructions are only built when the
+    exception is converted to a string.
+    """
+
+    def __init__(self, user_email: str, service_name: str, error: RefreshError):
+        super().__init__(user_email, service_name, error)
+        self.user_email = user_email
+        self.service_name = service_name
+        self.error = error
+
+    def __str__(self) -> str:
+        return _token_refresh_message(self.error, self.user_email, self.service_name)
+
+
+def _is_token_expired_or_revoked(error: RefreshError) -> bool:
+    """Return True if the refresh failed because the token expired or was revoked."""
+    error_str = str(error).lower()
+    return "invalid_grant" in error_str or "expired or revoked" in error_str
+
+
+def _token_refresh_message(
     error: RefreshError, user_email: str, service_name: str
 ) -> str:
     """
-    Handle token refresh errors gracefully, particularly expired/revoked tokens.
+    Build the user-facing message for a token refresh failure.
 
     Args:
         error: The RefreshError that occurred
@@ -355,16 +444,7 @@ def _handle_token_refresh_error(
     Returns:
         A user-friendly error message with instructions for reauthentication
     """
-    error_str = str(error)
-
-    if (
-        "invalid_grant" in error_str.lower()
-        or "expired or revoked" in error_str.lower()
-    ):
-        logger.warning(
-            f"Token expired or revoked for user {user_email} accessing {service_name}"
-        )
-
+    if _is_token_expired_or_revoked(error):
         service_display_name = f"Google {service_name.title()}"
 
         return (
@@ -380,13 +460,36 @@ def _handle_token_refresh_error(
             f"3. Retry your original command\n\n"
             f"The application will automatically use the new credentials once authentication is complete."
         )
+    return (
+        f"Authentication error occurred for {user_email}. "
+        f"Please try running `start_google_auth` with your email and the appropriate service name to reauthenticate."
+    )
+
+
+def _handle_token_refresh_error(
+    error: RefreshError, user_email: str, service_name: str
+) -> TokenRefreshRequired:
+    """
+    Handle token refresh errors gracefully, particularly expired/revoked tokens.
+
+    Args:
+        error: The RefreshError that occurred
+        user_email: User's email address
+        service_name: Name of the Google service
+
+    Returns:
+        A TokenRefreshRequired exception for the caller to raise
+    """
+    if _is_token_expired_or_revoked(error):
+        logger.warning(
+            "Token expired or revoked for user %s accessing %s",
+            user_email,
+            service_name,
+        )
     else:
         # Handle other types of refresh errors
-        logger.error(f"Unexpected refresh error for user {user_email}: {error}")
-        return (
-            f"Authentication error occurred for {user_email}. "
-            f"Please try running `start_google_auth` with your email and the appropriate service name to reauthenticate."
-        )
+        logger.error("Unexpected refresh error for user %s: %s", user_email, error)
+    return TokenRefreshRequired(user_email, service_name, error)
 
 
 def require_google_service(
@@ -410,6 +513,14 @@ def require_google_service(
     """
 
     def decorator(func: Callable) -> Callable:
+        # The wrapper awaits the tool, and FastMCP only takes its direct-await
+        # path for coroutine functions, so reject sync tools up front.
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(
+                f"Function '{func.__name__}' decorated with @require_google_service "
+                "must be an async function."
+            )
+
         original_sig = inspect.signature(func)
         params = list(original_sig.parameters.values())
 
@@ -427,6 +538,17 @@ def require_google_service(
         skip_count = 2 if injects_email else 1
         wrapper_sig = original_sig.replace(parameters=params[skip_count:])
 
+        # Resolve service configuration and scopes once at decoration time;
+        # these are constant for the lifetime of the tool.
+        if service_type not in SERVICE_CONFIGS:
+            raise ValueError(f"Unknown service type: {service_type}")
+
+        service_name, default_version = SERVICE_CONFIGS[service_type]
+        service_version = version or default_version
+        resolved_scopes = _resolve_scopes(scopes)
+        resolved_scope_set = frozenset(resolved_scopes)
+        tool_name = func.__name__
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Note: `args` and `kwargs` are now the arguments for the *wrapper*,
@@ -434,38 +556,29 @@ def require_google_service(
 
             # Get authentication context early to determine OAuth mode
             authenticated_user, auth_method, mcp_session_id = _get_auth_context(
-                func.__name__
+                tool_name
             )
 
             # In single-user mode, skip the authenticated_user check since
             # credentials are loaded from file without session context
-            import os
-
             is_single_user_mode = os.getenv("MCP_SINGLE_USER_MODE") == "1"
 
             if not authenticated_user and not is_single_user_mode:
-                raise Exception(
-                    f"Authentication required for {func.__name__}, but no authenticated user was found."
-                )
-
-            # Get service configuration from the decorator's arguments
-            if service_type not in SERVICE_CONFIGS:
-                raise Exception(f"Unknown service type: {service_type}")
-
-            config = SERVICE_CONFIGS[service_type]
-            service_name = config["service"]
-            service_version = version or config["version"]
-
-            # Resolve scopes
-            resolved_scopes = _resolve_scopes(scopes)
+                raise GoogleServiceAuthError(tool_name)
 
+            # A single try covers authentication and the tool call; this flag
+            # tells the handlers which phase an exception came from.
+            authenticated = False
             try:
-                tool_name = func.__name__
-
                 # Log authentication status
-                logger.debug(
-                    f"[{tool_name}] Auth: {authenticated_user or 'none'} via {auth_method or 'none'} (session: {mcp_session_id[:8] if mcp_session_id else 'none'})"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "[%s] Auth: %s via %s (session: %s)",
+                        tool_name,
+                        authenticated_user or "none",
+                        auth_method or "none",
+                        mcp_session_id[:8] if mcp_session_id else "none",
+                    )
 
                 # Detect OAuth version
                 use_oauth21 = _detect_oauth_version(
@@ -479,34 +592,43 @@ def require_google_service(
                     service_version,
                     tool_name,
                     resolved_scopes,
+                    resolved_scope_set,
                     mcp_session_id,
                     authenticated_user,
                 )
-            except GoogleAuthenticationError as e:
-                logger.error(
-                    f"[{tool_name}] GoogleAuthenticationError during authentication. "
-                    f"Method={auth_method or 'none'}, User={authenticated_user or 'none'}, "
-                    f"Service={service_name} v{service_version}, MCPSessionID={mcp_session_id or 'none'}: {e}"
-                )
-                # Re-raise the original error without wrapping it
-                raise
+                authenticated = True
 
-            try:
                 # Prepend injected parameters to the original arguments
                 if injects_email:
                     return await func(service, actual_user_email, *args, **kwargs)
                 return await func(service, *args, **kwargs)
+            except GoogleAuthenticationError as e:
+                if not authenticated:
+                    logger.error(
+                        "[%s] GoogleAuthenticationError during authentication. "
+                        "Method=%s, User=%s, Service=%s v%s, MCPSessionID=%s: %s",
+                        tool_name,
+                        auth_method or "none",
+                        authenticated_user or "none",
+                        service_name,
+                        service_version,
+                        mcp_session_id or "none",
+                        e,
+                    )
+                # Re-raise the original error without wrapping it
+                raise
             except RefreshError as e:
-                error_message = _handle_token_refresh_error(
+                if not authenticated:
+                    raise
+                raise _handle_token_refresh_error(
                     e, actual_user_email, service_name
-                )
-                raise Exception(error_message)
+                ) from e
 
         # Set the wrapper's signature to the one without 'service'
         wrapper.__signature__ = wrapper_sig
 
         # Attach required scopes to the wrapper for tool filtering
-        wrapper._required_google_scopes = _resolve_scopes(scopes)
+        wrapper._required_google_scopes = resolved_scopes
 
         return wrapper
 
@@ -534,6 +656,12 @@ def require_multiple_services(service_configs: List[Dict[str, Any]]):
     """
 
     def decorator(func: Callable) -> Callable:
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(
+                f"Function '{func.__name__}' decorated with @require_multiple_services "
+                "must be an async function."
+            )
+
         original_sig = inspect.signature(func)
 
         service_param_names = {config["param_name"] for config in service_configs}
@@ -544,6 +672,26 @@ def require_multiple_services(service_configs: List[Dict[str, Any]]):
 
         wrapper_sig = original_sig.replace(parameters=filtered_params)
 
+        # Resolve every service's configuration once at decoration time
+        resolved_configs = []
+        for config in service_configs:
+            service_type = config["service_type"]
+            if service_type not in SERVICE_CONFIGS:
+                raise ValueError(f"Unknown service type: {service_type}")
+
+            service_name, default_version = SERVICE_CONFIGS[service_type]
+            resolved_scopes = _resolve_scopes(config["scopes"])
+            resolved_configs.append(
+                (
+                    service_type,
+                    service_name,
+                    config.get("version") or default_version,
+                    resolved_scopes,
+                    frozenset(resolved_scopes),
+                    config["param_name"],
+                )
+            )
+
         @wraps(func)
         async def wrapper(*args, **kwargs):
             # Get authentication context early
@@ -551,69 +699,71 @@ def require_multiple_services(service_configs: List[Dict[str, Any]]):
             authenticated_user, _, mcp_session_id = _get_auth_context(tool_name)
 
             if not authenticated_user:
-                raise Exception(
-                    f"Authentication required for {tool_name}, but no authenticated user was found."
-                )
+                raise GoogleServiceAuthError(tool_name)
 
-            # Authenticate all services
-            for config in service_configs:
-                service_type = config["service_type"]
-                scopes = config["scopes"]
-                param_name = config["param_name"]
-                version = config.get("version")
-
-                if service_type not in SERVICE_CONFIGS:
-                    raise Exception(f"Unknown service type: {service_type}")
-
-                service_config = SERVICE_CONFIGS[service_type]
-                service_name = service_config["service"]
-                service_version = version or service_config["version"]
-                resolved_scopes = _resolve_scopes(scopes)
-
-                try:
-                    # Detect OAuth version (simplified for multiple services)
-                    use_oauth21 = (
-                        is_oauth21_enabled() and authenticated_user is not None
-                    )
+            # Detect OAuth version (simplified for multiple services)
+            use_oauth21 = is_oauth21_enabled() and authenticated_user is not None
 
-                    # Authenticate service
-                    service, _ = await _authenticate_service(
+            # Authenticate all services concurrently; they are independent
+            results = await asyncio.gather(
+                *(
+                    _authenticate_service(
                         use_oauth21,
                         service_name,
                         service_version,
                         tool_name,
                         resolved_scopes,
+                        resolved_scope_set,
                         mcp_session_id,
                         authenticated_user,
                     )
+                    for (
+                        _,
+                        service_name,
+                        service_version,
+                        resolved_scopes,
+                        resolved_scope_set,
+                        _,
+                    ) in resolved_configs
+                ),
+                return_exceptions=True,
+            )
 
-                    # Inject service with specified parameter name
-                    kwargs[param_name] = service
-
-                except GoogleAuthenticationError as e:
+            for (service_type, _, _, _, _, param_name), result in zip(
+                resolved_configs, results
+            ):
+                if isinstance(result, GoogleAuthenticationError):
                     logger.error(
-                        f"[{tool_name}] GoogleAuthenticationError for service '{service_type}' (user: {authenticated_user}): {e}"
+                        "[%s] GoogleAuthenticationError for service '%s' (user: %s): %s",
+                        tool_name,
+                        service_type,
+                        authenticated_user,
+                        result,
                     )
                     # Re-raise the original error without wrapping it
-                    raise
+                    raise result
+                if isinstance(result, BaseException):
+                    raise result
+
+                # Inject service with specified parameter name
+                kwargs[param_name] = result[0]
 
             # Call the original function with refresh error handling
             try:
                 return await func(*args, **kwargs)
             except RefreshError as e:
                 # Handle token refresh errors gracefully
-                error_message = _handle_token_refresh_error(
+                raise _handle_token_refresh_error(
                     e, authenticated_user, "Multiple Services"
-                )
-                raise Exception(error_message)
+                ) from e
 
         # Set the wrapper's signature
         wrapper.__signature__ = wrapper_sig
 
         # Attach all required scopes to the wrapper for tool filtering
         all_scopes = []
-        for config in service_configs:
-            all_scopes.extend(_resolve_scopes(config["scopes"]))
+        for _, _, _, resolved_scopes, _, _ in resolved_configs:
+            all_scopes.extend(resolved_scopes)
         wrapper._required_google_scopes = all_scopes
 
         return wrapper
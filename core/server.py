@@ -1,5 +1,9 @@
+import asyncio
 import logging
-from typing import List, Optional
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
 from importlib import metadata
 
 from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
@@ -51,9 +55,46 @@ class SecureFastMCP(FastMCP):
         return app
 
 
+# Google API calls are blocking and run on the loop's default executor
+# (core.utils.run_blocking), which is capped at min(32, cpu_count + 4) threads.
+_DEFAULT_IO_THREADS = 64
+
+
+def _io_threads() -> int:
+    """Read WORKSPACE_MCP_IO_THREADS, falling back to the default if invalid."""
+    value = os.getenv("WORKSPACE_MCP_IO_THREADS")
+    if value is None:
+        return _DEFAULT_IO_THREADS
+    try:
+        threads = int(value)
+    except ValueError:
+        threads = 0
+    if threads < 1:
+        logger.warning(
+            "Invalid WORKSPACE_MCP_IO_THREADS=%r, using %d",
+            value,
+            _DEFAULT_IO_THREADS,
+        )
+        return _DEFAULT_IO_THREADS
+    return threads
+
+
+_IO_THREADS = _io_threads()
+
+
+@asynccontextmanager
+async def _server_lifespan(_server: FastMCP) -> AsyncIterator[dict]:
+    """Size the default executor for concurrent Google API calls."""
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=_IO_THREADS, thread_name_prefix="gws-io")
+    )
+    yield {}
+
+
 server = SecureFastMCP(
     name="google_workspace",
     auth=None,
+    lifespan=_server_lifespan,
 )
 
 # Add the AuthInfo middleware to inject authentication into FastMCP context
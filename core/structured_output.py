@@ -5,99 +5,315 @@ This module provides helper functions for creating tool results that include
 both human-readable text content and machine-parseable structured data.
 """
 
-from dataclasses import asdict, is_dataclass
-from typing import Any
+import itertools
+
+from dataclasses import MISSING, fields, is_dataclass
+from functools import lru_cache
+from types import UnionType
+from typing import Any, Union, get_args, get_origin, get_type_hints
 
 from fastmcp.tools.tool import ToolResult
 from mcp.types import TextContent
 from pydantic import TypeAdapter
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> tuple[str, ...]:
+    """Return a dataclass's field names, computed once per class."""
+    return tuple(f.name for f in fields(cls))
+
+
 def _coerce_none(obj: Any) -> Any:
-    """Recursively remove None values from dicts and lists.
+    """Recursively convert dataclasses to dicts and remove None values.
 
     MCP output schema validation does not support JSON Schema ``anyOf``,
     so ``Optional`` fields that are ``None`` fail validation.  Removing
     them from the output is safe because every ``Optional`` field already
     has a default and is not listed in the schema's ``required`` array.
+
+    Dataclasses are converted in the same walk rather than via ``asdict``,
+    so large results are only copied once.
     """
     if isinstance(obj, dict):
         return {k: _coerce_none(v) for k, v in obj.items() if v is not None}
-    if isinstance(obj, list):
+    if isinstance(obj, (list, tuple)):
         return [_coerce_none(item) for item in obj]
+    if is_dataclass(obj) and not isinstance(obj, type):
+        to_dict = getattr(obj, "_to_dict", None)
+        if to_dict is not None:
+            return to_dict()
+        return {
+            name: _coerce_none(value)
+            for name in _field_names(type(obj))
+            if (value := getattr(obj, name)) is not None
+        }
     return obj
 
 
-def _strip_any_of(schema: Any) -> Any:
-    """Recursively replace ``anyOf`` nullable patterns with the non-null type.
+_SCALAR_TYPES = (str, int, float, bool)
+
+
+def _field_conversion(field_type: Any) -> str:
+    """Return the expression that converts a non-None field value ``v``."""
+    args = [arg for arg in get_args(field_type) if arg is not type(None)]
+    if get_origin(field_type) in (Union, UnionType) and len(args) == 1:
+        field_type = args[0]  # Optional[X] -> X; None is gated separately
+
+    if field_type in _SCALAR_TYPES:
+        return "v"
+    if is_dataclass(field_type) and hasattr(field_type, "_to_dict"):
+        return "v._to_dict()"
+    if get_origin(field_type) is list:
+        (item_type,) = get_args(field_type) or (Any,)
+        if item_type in _SCALAR_TYPES:
+            return "list(v)"
+        if is_dataclass(item_type) and hasattr(item_type, "_to_dict"):
+            return "[item._to_dict() for item in v]"
+    return "_coerce_none(v)"
+
+
+def fast_dict(cls: type) -> type:
+    """Class decorator that generates a ``_to_dict`` method for a dataclass.
+
+    The generated method reads each field directly, in straight-line code,
+    and omits ``None`` values exactly like ``_coerce_none``.  Scalar fields
+    are copied as-is and ``@fast_dict`` models, or lists of them, call their
+    ``_to_dict`` directly; anything else goes through ``_coerce_none``.
+    ``_coerce_none`` dispatches to the generated method, so decorated models
+    skip the generic field walk.  Apply it above ``@dataclass``, after any
+    nested models it refers to.
+    """
+    if not is_dataclass(cls):
+        raise TypeError(f"@fast_dict requires a dataclass, got {cls.__name__}")
+
+    hints = get_type_hints(cls)
+    lines = ["def _to_dict(self):", "    d = {}"]
+    for name in _field_names(cls):
+        lines.append(f"    v = self.{name}")
+        lines.append("    if v is not None:")
+        lines.append(f"        d[{name!r}] = {_field_conversion(hints.get(name, Any))}")
+    lines.append("    return d")
+
+    namespace = {"_coerce_none": _coerce_none}
+    exec("\n".join(lines), namespace)
+    cls._to_dict = namespace["_to_dict"]
+    return cls
+
+
+def _needs_coercion(obj: Any) -> bool:
+    """Return True if ``obj`` contains a None value or a dataclass.
+
+    Scans with an explicit stack and without building new containers, so
+    ``create_tool_result`` can skip the ``_coerce_none`` rebuild for the
+    common case of plain data with no ``None`` values.
+    """
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if node is None:
+            return True
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple)):
+            stack.extend(node)
+        elif is_dataclass(node) and not isinstance(node, type):
+            return True
+    return False
+
+
+def _collapse_any_of(node: dict[str, Any]) -> dict[str, Any]:
+    """Replace an ``anyOf`` nullable pattern with the non-null type.
 
     Pydantic generates ``{"anyOf": [{"type": "string"}, {"type": "null"}]}``
     for ``Optional[str]``, but MCP schema validation does not support
     ``anyOf``.  This collapses such patterns to ``{"type": "string"}``,
     preserving all sibling keys (``default``, ``title``, etc.).
     """
-    if isinstance(schema, list):
-        return [_strip_any_of(item) for item in schema]
-    if not isinstance(schema, dict):
-        return schema
-
-    # Recurse into all dict values first
-    result = {k: _strip_any_of(v) for k, v in schema.items()}
-
-    # Collapse anyOf nullable patterns
-    if "anyOf" in result:
-        any_of = result["anyOf"]
-        non_null = [opt for opt in any_of if opt != {"type": "null"}]
+    if "anyOf" in node:
+        non_null = [
+            opt
+            for opt in node["anyOf"]
+            if not (
+                isinstance(opt, dict) and len(opt) == 1 and opt.get("type") == "null"
+            )
+        ]
         if len(non_null) == 1:
             # Replace the anyOf with the single non-null option, keep siblings
-            collapsed = {k: v for k, v in result.items() if k != "anyOf"}
+            collapsed = {k: v for k, v in node.items() if k != "anyOf"}
             collapsed.update(non_null[0])
             return collapsed
+    return node
 
-    return result
 
+def _normalize_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Inline ``$ref`` references and strip ``anyOf`` nullables in one pass.
 
-def _inline_refs(schema: dict[str, Any]) -> dict[str, Any]:
-    """Inline all ``$ref`` references and remove ``$defs``.
+    MCP schema validation supports neither ``$ref`` / ``$defs`` nor
+    ``anyOf``.  Pydantic generates the former for nested dataclasses and
+    the latter for ``Optional`` fields.  Every ``$ref`` is replaced by the
+    referenced definition (merged with any sibling keys such as
+    ``title``), nullable ``anyOf`` patterns are collapsed bottom-up, and
+    the top-level ``$defs`` block is dropped.
 
-    MCP schema validation does not support ``$ref`` / ``$defs``.
-    Pydantic generates these for nested dataclasses. This function
-    resolves every ``$ref`` by substituting the referenced definition
-    inline, then drops the top-level ``$defs`` block.
+    Recursive models cannot be inlined, so a ``$ref`` back into a
+    definition that is already being expanded is left in place and only
+    those definitions are kept under ``$defs``.
+
+    Containers are only copied once something beneath them changes; clean
+    subtrees are returned by reference.
     """
     defs = schema.get("$defs", {})
-    if not defs:
-        return schema
+    expanding: set[str] = set()
+    kept: dict[str, Any] = {}
 
-    def _resolve(node: Any) -> Any:
+    def _walk(node: Any) -> Any:
         if isinstance(node, list):
-            return [_resolve(item) for item in node]
+            out = None
+            for i, item in enumerate(node):
+                new = _walk(item)
+                if out is None and new is not item:
+                    out = node[:i]
+                if out is not None:
+                    out.append(new)
+            return node if out is None else out
         if not isinstance(node, dict):
             return node
-        if "$ref" in node:
-            ref_path = node["$ref"]  # e.g. "#/$defs/CalendarInfo"
+        ref_path = node.get("$ref")  # e.g. "#/$defs/CalendarInfo"
+        if ref_path is not None:
             def_name = ref_path.rsplit("/", 1)[-1]
+            if def_name in expanding:
+                kept.setdefault(def_name, None)
+                return node
             if def_name in defs:
-                # Merge any sibling keys (e.g. title) with the resolved def
-                resolved = {k: v for k, v in node.items() if k != "$ref"}
-                resolved.update(_resolve(defs[def_name]))
-                return resolved
-        return {k: _resolve(v) for k, v in node.items()}
-
-    result = _resolve(schema)
-    result.pop("$defs", None)
+                expanding.add(def_name)
+                try:
+                    resolved = {k: _walk(v) for k, v in node.items() if k != "$ref"}
+                    resolved.update(_walk(defs[def_name]))
+                finally:
+                    expanding.discard(def_name)
+                return _collapse_any_of(resolved)
+        out = None
+        for i, (key, value) in enumerate(node.items()):
+            new = _walk(value)
+            if out is None and new is not value:
+                out = dict(itertools.islice(node.items(), i))
+            if out is not None:
+                out[key] = new
+        return _collapse_any_of(node if out is None else out)
+
+    result = _walk({k: v for k, v in schema.items() if k != "$defs"})
+
+    # Normalize each recursive definition; doing so may reveal more of them
+    while any(value is None for value in kept.values()):
+        for def_name in [name for name, value in kept.items() if value is None]:
+            expanding.add(def_name)
+            kept[def_name] = _walk(defs[def_name])
+            expanding.discard(def_name)
+
+    if kept:
+        result["$defs"] = kept
     return result
 
 
+class _UnsupportedSchema(Exception):
+    """Raised when ``_dataclass_schema`` cannot handle a model."""
+
+
+_JSON_TYPES = {str: "string", int: "integer", float: "number", bool: "boolean"}
+_JSON_DEFAULTS = (str, int, float, bool, type(None))
+
+
+def _unwrap_optional(tp: Any) -> tuple[Any, bool]:
+    """Return ``(X, True)`` for ``Optional[X]`` and ``(tp, False)`` otherwise."""
+    if get_origin(tp) in (Union, UnionType):
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(args) != 1 or len(args) == len(get_args(tp)):
+            raise _UnsupportedSchema(tp)
+        return args[0], True
+    return tp, False
+
+
+def _type_schema(tp: Any, seen: frozenset) -> dict[str, Any]:
+    """Return the normalized JSON schema for a (non-Optional) field type."""
+    if tp is Any:
+        return {}
+    if tp in _JSON_TYPES:
+        return {"type": _JSON_TYPES[tp]}
+    if is_dataclass(tp):
+        return _dataclass_schema(tp, seen)
+    origin = get_origin(tp) or tp
+    if origin is list:
+        (item_type,) = get_args(tp) or (Any,)
+        return {"items": _type_schema(item_type, seen), "type": "array"}
+    if origin is dict and get_args(tp)[1:] in ((), (Any,)):
+        return {"additionalProperties": True, "type": "object"}
+    raise _UnsupportedSchema(tp)
+
+
+def _dataclass_schema(cls: type, seen: frozenset = frozenset()) -> dict[str, Any]:
+    """Build the normalized schema for a dataclass directly from its fields.
+
+    Produces the same output as ``_normalize_schema(TypeAdapter(cls)
+    .json_schema())`` (key order included) for the types the models in
+    this repo use: scalars, ``Any``, ``list``, ``dict[str, Any]``, nested
+    dataclasses and ``Optional`` of those.  Anything else, including
+    recursive models, raises ``_UnsupportedSchema``.
+    """
+    if cls in seen:
+        raise _UnsupportedSchema(cls)
+    seen = seen | {cls}
+    hints = get_type_hints(cls)
+    properties: dict[str, Any] = {}
+    required: list[str] = []
+    for f in fields(cls):
+        field_type, optional = _unwrap_optional(hints[f.name])
+        head: dict[str, Any] = {}
+        if f.default is not MISSING:
+            if not isinstance(f.default, _JSON_DEFAULTS):
+                raise _UnsupportedSchema(f.default)
+            head["default"] = f.default
+        elif f.default_factory is MISSING:
+            required.append(f.name)
+        if is_dataclass(field_type):
+            # Pydantic emits a bare $ref here, so the field gets no title
+            properties[f.name] = {**head, **_type_schema(field_type, seen)}
+            continue
+        head["title"] = f.name.title().replace("_", " ").strip()
+        body = _type_schema(field_type, seen)
+        if optional:
+            properties[f.name] = {**head, **body}
+        else:
+            properties[f.name] = dict(sorted({**head, **body}.items()))
+
+    schema: dict[str, Any] = {"properties": properties}
+    if required:
+        schema["required"] = required
+    schema["title"] = cls.__name__
+    schema["type"] = "object"
+    return schema
+
+
+@lru_cache(maxsize=None)
 def generate_schema(cls: type) -> dict[str, Any]:
     """Generate an MCP-compatible JSON schema for a dataclass.
 
-    Uses Pydantic's ``TypeAdapter`` then:
+    Common models are built straight from their fields by
+    ``_dataclass_schema``.  Anything it does not cover falls back to
+    Pydantic's ``TypeAdapter``, then:
     1. Inlines ``$ref`` / ``$defs`` (not supported by MCP)
     2. Strips ``anyOf`` nullable patterns (not supported by MCP)
+
+    Results are memoized per class; callers must not mutate the returned
+    schema.
     """
-    raw = TypeAdapter(cls).json_schema()
-    return _strip_any_of(_inline_refs(raw))
+    try:
+        return _dataclass_schema(cls)
+    except _UnsupportedSchema:
+        return _normalize_schema(TypeAdapter(cls).json_schema())
+
+
+# Bound once: the text is our own str output, so skip pydantic validation
+_text_block = TextContent.model_construct
 
 
 def create_tool_result(
@@ -114,8 +330,7 @@ def create_tool_result(
     Returns:
         ToolResult with both content and structured_content populated
     """
-    structured = asdict(data) if is_dataclass(data) else data
     return ToolResult(
-        content=[TextContent(type="text", text=text)],
-        structured_content=_coerce_none(structured),
+        content=[_text_block(type="text", text=text)],
+        structured_content=_coerce_none(data) if _needs_coercion(data) else data,
     )
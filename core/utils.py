@@ -7,7 +7,7 @@ import ssl
 import asyncio
 import functools
 
-from typing import List, Optional
+from typing import Any, Callable, List, Optional
 
 from googleapiclient.errors import HttpError
 from .api_enablement import get_api_enablement_message
@@ -242,6 +242,17 @@ def extract_office_xml_text(file_bytes: bytes, mime_type: str) -> Optional[str]:
         return None
 
 
+async def run_blocking(func: Callable[[], Any]) -> Any:
+    """Run a blocking API call on the server's I/O executor.
+
+    Uses the loop's default executor, which the server lifespan sizes for
+    network-bound Google API calls (``WORKSPACE_MCP_IO_THREADS``).  Unlike
+    ``asyncio.to_thread`` this does not copy the caller's context into the
+    worker thread; ``execute()`` does not read any context vars.
+    """
+    return await asyncio.get_running_loop().run_in_executor(None, func)
+
+
 def handle_http_errors(
     tool_name: str, is_read_only: bool = False, service_type: Optional[str] = None
 ):
@@ -5,13 +5,18 @@ Dataclass models representing the structured data returned by Apps Script tools.
 These models provide machine-parseable JSON alongside the human-readable text output.
 """
 
+import json
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib import resources
 from typing import Any, Optional
 
-from core.structured_output import generate_schema
+from core.structured_output import fast_dict
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ScriptProjectSummary:
     """Summary of a script project from list results."""
 
@@ -21,7 +26,8 @@ class ScriptProjectSummary:
     modified_time: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ListScriptProjectsResult:
     """Structured result from list_script_projects."""
 
@@ -30,7 +36,8 @@ class ListScriptProjectsResult:
     next_page_token: Optional[str] = None
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ScriptFile:
     """A file within a script project."""
 
@@ -38,8 +45,15 @@ class ScriptFile:
     file_type: str
     source_preview: Optional[str] = None
 
+    # file_type / process_status come from a tiny fixed vocabulary; interning
+    # lets every instance in a large result share one string object.
+    def __post_init__(self) -> None:
+        if isinstance(self.file_type, str):
+            self.file_type = sys.intern(self.file_type)
 
-@dataclass
+
+@fast_dict
+@dataclass(slots=True)
 class GetScriptProjectResult:
     """Structured result from get_script_project."""
 
@@ -51,7 +65,8 @@ class GetScriptProjectResult:
     files: list[ScriptFile]
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class GetScriptContentResult:
     """Structured result from get_script_content."""
 
@@ -62,7 +77,8 @@ class GetScriptContentResult:
     found: bool = True
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class CreateScriptProjectResult:
     """Structured result from create_script_project."""
 
@@ -71,15 +87,21 @@ class CreateScriptProjectResult:
     edit_url: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class UpdatedFile:
     """A file that was updated in a script project."""
 
     name: str
     file_type: str
 
+    def __post_init__(self) -> None:
+        if isinstance(self.file_type, str):
+            self.file_type = sys.intern(self.file_type)
+
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class UpdateScriptContentResult:
     """Structured result from update_script_content."""
 
@@ -88,7 +110,8 @@ class UpdateScriptContentResult:
     files: list[UpdatedFile]
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class RunScriptFunctionResult:
     """Structured result from run_script_function."""
 
@@ -98,7 +121,8 @@ class RunScriptFunctionResult:
     error_message: Optional[str] = None
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class CreateDeploymentResult:
     """Structured result from create_deployment."""
 
@@ -108,7 +132,8 @@ class CreateDeploymentResult:
     description: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DeploymentSummary:
     """Summary of a deployment from list results."""
 
@@ -117,7 +142,8 @@ class DeploymentSummary:
     update_time: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ListDeploymentsResult:
     """Structured result from list_deployments."""
 
@@ -126,7 +152,8 @@ class ListDeploymentsResult:
     deployments: list[DeploymentSummary]
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class UpdateDeploymentResult:
     """Structured result from update_deployment."""
 
@@ -135,7 +162,8 @@ class UpdateDeploymentResult:
     description: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DeleteDeploymentResult:
     """Structured result from delete_deployment."""
 
@@ -144,7 +172,8 @@ class DeleteDeploymentResult:
     deleted: bool = True
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ProcessSummary:
     """Summary of a script execution process."""
 
@@ -153,8 +182,13 @@ class ProcessSummary:
     start_time: str
     duration: str
 
+    def __post_init__(self) -> None:
+        if isinstance(self.process_status, str):
+            self.process_status = sys.intern(self.process_status)
+
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ListScriptProcessesResult:
     """Structured result from list_script_processes."""
 
@@ -163,7 +197,8 @@ class ListScriptProcessesResult:
     processes: list[ProcessSummary] = field(default_factory=list)
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DeleteScriptProjectResult:
     """Structured result from delete_script_project."""
 
@@ -171,7 +206,8 @@ class DeleteScriptProjectResult:
     deleted: bool = True
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class VersionSummary:
     """Summary of a script version."""
 
@@ -180,7 +216,8 @@ class VersionSummary:
     create_time: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ListVersionsResult:
     """Structured result from list_versions."""
 
@@ -189,7 +226,8 @@ class ListVersionsResult:
     versions: list[VersionSummary]
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class CreateVersionResult:
     """Structured result from create_version."""
 
@@ -199,7 +237,8 @@ class CreateVersionResult:
     create_time: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class GetVersionResult:
     """Structured result from get_version."""
 
@@ -209,27 +248,41 @@ class GetVersionResult:
     create_time: str
 
 
-@dataclass
-class MetricDataPoint:
-    """A single metric data point."""
+@fast_dict
+@dataclass(slots=True)
+class GetVersionsResult:
+    """Structured result from get_versions."""
 
-    start_time: str
-    end_time: str
-    value: str
+    script_id: str
+    total_found: int
+    versions: list[GetVersionResult] = field(default_factory=list)
+    failed_versions: list[int] = field(default_factory=list)
+
+
+@fast_dict
+@dataclass(slots=True)
+class MetricSeries:
+    """A metric time series stored as parallel lists, one entry per interval."""
+
+    start_times: list[str] = field(default_factory=list)
+    end_times: list[str] = field(default_factory=list)
+    values: list[str] = field(default_factory=list)
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class GetScriptMetricsResult:
     """Structured result from get_script_metrics."""
 
     script_id: str
     granularity: str
-    active_users: list[MetricDataPoint] = field(default_factory=list)
-    total_executions: list[MetricDataPoint] = field(default_factory=list)
-    failed_executions: list[MetricDataPoint] = field(default_factory=list)
+    active_users: MetricSeries = field(default_factory=MetricSeries)
+    total_executions: MetricSeries = field(default_factory=MetricSeries)
+    failed_executions: MetricSeries = field(default_factory=MetricSeries)
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class GenerateTriggerCodeResult:
     """Structured result from generate_trigger_code."""
 
@@ -240,21 +293,72 @@ class GenerateTriggerCodeResult:
     is_simple_trigger: bool
 
 
-# Pre-generated JSON schemas for use in @server.tool() decorators
-LIST_SCRIPT_PROJECTS_SCHEMA = generate_schema(ListScriptProjectsResult)
-GET_SCRIPT_PROJECT_SCHEMA = generate_schema(GetScriptProjectResult)
-GET_SCRIPT_CONTENT_SCHEMA = generate_schema(GetScriptContentResult)
-CREATE_SCRIPT_PROJECT_SCHEMA = generate_schema(CreateScriptProjectResult)
-UPDATE_SCRIPT_CONTENT_SCHEMA = generate_schema(UpdateScriptContentResult)
-RUN_SCRIPT_FUNCTION_SCHEMA = generate_schema(RunScriptFunctionResult)
-CREATE_DEPLOYMENT_SCHEMA = generate_schema(CreateDeploymentResult)
-LIST_DEPLOYMENTS_SCHEMA = generate_schema(ListDeploymentsResult)
-UPDATE_DEPLOYMENT_SCHEMA = generate_schema(UpdateDeploymentResult)
-DELETE_DEPLOYMENT_SCHEMA = generate_schema(DeleteDeploymentResult)
-LIST_SCRIPT_PROCESSES_SCHEMA = generate_schema(ListScriptProcessesResult)
-DELETE_SCRIPT_PROJECT_SCHEMA = generate_schema(DeleteScriptProjectResult)
-LIST_VERSIONS_SCHEMA = generate_schema(ListVersionsResult)
-CREATE_VERSION_SCHEMA = generate_schema(CreateVersionResult)
-GET_VERSION_SCHEMA = generate_schema(GetVersionResult)
-GET_SCRIPT_METRICS_SCHEMA = generate_schema(GetScriptMetricsResult)
-GENERATE_TRIGGER_CODE_SCHEMA = generate_schema(GenerateTriggerCodeResult)
+# Result models whose schemas are baked into _schemas.json by
+# scripts/bake_schemas.py; re-run it after changing any of them.
+SCHEMA_MODELS = (
+    "ListScriptProjectsResult",
+    "GetScriptProjectResult",
+    "GetScriptContentResult",
+    "CreateScriptProjectResult",
+    "UpdateScriptContentResult",
+    "RunScriptFunctionResult",
+    "CreateDeploymentResult",
+    "ListDeploymentsResult",
+    "UpdateDeploymentResult",
+    "DeleteDeploymentResult",
+    "ListScriptProcessesResult",
+    "DeleteScriptProjectResult",
+    "ListVersionsResult",
+    "CreateVersionResult",
+    "GetVersionResult",
+    "GetVersionsResult",
+    "GetScriptMetricsResult",
+    "GenerateTriggerCodeResult",
+)
+
+
+@lru_cache(maxsize=None)
+def _load_schemas() -> dict[str, Any]:
+    """Load the baked schemas, generating them if _schemas.json is missing."""
+    try:
+        baked = resources.files(__package__).joinpath("_schemas.json")
+        return json.loads(baked.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        from core.structured_output import generate_schema
+
+        return {name: generate_schema(globals()[name]) for name in SCHEMA_MODELS}
+
+
+# Pre-generated JSON schemas for use in @server.tool() decorators.  They are
+# loaded on first access through the module __getattr__ (PEP 562), so importing
+# the models alone does not read _schemas.json.
+_SCHEMA_SPECS = {
+    "LIST_SCRIPT_PROJECTS_SCHEMA": "ListScriptProjectsResult",
+    "GET_SCRIPT_PROJECT_SCHEMA": "GetScriptProjectResult",
+    "GET_SCRIPT_CONTENT_SCHEMA": "GetScriptContentResult",
+    "CREATE_SCRIPT_PROJECT_SCHEMA": "CreateScriptProjectResult",
+    "UPDATE_SCRIPT_CONTENT_SCHEMA": "UpdateScriptContentResult",
+    "RUN_SCRIPT_FUNCTION_SCHEMA": "RunScriptFunctionResult",
+    "CREATE_DEPLOYMENT_SCHEMA": "CreateDeploymentResult",
+    "LIST_DEPLOYMENTS_SCHEMA": "ListDeploymentsResult",
+    "UPDATE_DEPLOYMENT_SCHEMA": "UpdateDeploymentResult",
+    "DELETE_DEPLOYMENT_SCHEMA": "DeleteDeploymentResult",
+    "LIST_SCRIPT_PROCESSES_SCHEMA": "ListScriptProcessesResult",
+    "DELETE_SCRIPT_PROJECT_SCHEMA": "DeleteScriptProjectResult",
+    "LIST_VERSIONS_SCHEMA": "ListVersionsResult",
+    "CREATE_VERSION_SCHEMA": "CreateVersionResult",
+    "GET_VERSION_SCHEMA": "GetVersionResult",
+    "GET_VERSIONS_SCHEMA": "GetVersionsResult",
+    "GET_SCRIPT_METRICS_SCHEMA": "GetScriptMetricsResult",
+    "GENERATE_TRIGGER_CODE_SCHEMA": "GenerateTriggerCodeResult",
+}
+
+
+def __getattr__(name: str) -> dict[str, Any]:
+    """Resolve a ``*_SCHEMA`` constant and cache it as a module global."""
+    model = _SCHEMA_SPECS.get(name)
+    if model is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    schema = _load_schemas()[model]
+    globals()[name] = schema
+    return schema
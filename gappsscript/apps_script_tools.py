@@ -6,14 +6,19 @@ This module provides MCP tools for interacting with Google Apps Script API.
 
 import logging
 import asyncio
-from typing import List, Dict, Any, Optional
+import operator
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 
 from fastmcp.tools.tool import ToolResult
+from googleapiclient.errors import HttpError
 
 from auth.service_decorator import require_google_service
 from core.server import server
 from core.structured_output import create_tool_result
-from core.utils import handle_http_errors
+from core.utils import handle_http_errors, run_blocking
 from gappsscript.apps_script_models import (
     ScriptProjectSummary,
     ListScriptProjectsResult,
@@ -36,7 +41,8 @@ from gappsscript.apps_script_models import (
     ListVersionsResult,
     CreateVersionResult,
     GetVersionResult,
-    MetricDataPoint,
+    GetVersionsResult,
+    MetricSeries,
     GetScriptMetricsResult,
     GenerateTriggerCodeResult,
     LIST_SCRIPT_PROJECTS_SCHEMA,
@@ -54,12 +60,102 @@ from gappsscript.apps_script_models import (
     LIST_VERSIONS_SCHEMA,
     CREATE_VERSION_SCHEMA,
     GET_VERSION_SCHEMA,
+    GET_VERSIONS_SCHEMA,
     GET_SCRIPT_METRICS_SCHEMA,
     GENERATE_TRIGGER_CODE_SCHEMA,
 )
 
 logger = logging.getLogger(__name__)
 
+# Partial-response projections: projects.get only carries metadata and
+# projects.getContent only needs the fields the tools read from each file.
+_PROJECT_METADATA_FIELDS = "scriptId,title,creator,createTime,updateTime"
+_PROJECT_FILES_FIELDS = "files(name,type,source)"
+_PROJECT_FILE_NAMES_FIELDS = "files(name,type)"
+
+
+# Discovery collections (e.g. ``projects().versions()``) per service client
+_COLLECTIONS: "weakref.WeakKeyDictionary[Any, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _collection(service: Any, path: str) -> Any:
+    """Return ``service.<path>()`` for a dotted path like "projects.versions".
+
+    Building a discovery Resource sets up every method it exposes and costs
+    far more than building the request itself.  Collections hold no
+    per-request state, so each one is built once per service client.
+    """
+    collections = _COLLECTIONS.get(service)
+    if collections is None:
+        collections = _COLLECTIONS[service] = {}
+    resource = collections.get(path)
+    if resource is None:
+        resource = service
+        for name in path.split("."):
+            resource = getattr(resource, name)()
+        collections[path] = resource
+    return resource
+
+
+# Drive search for Apps Script files; only the page size and token vary per call
+_LIST_PROJECTS_PARAMS = {
+    "q": "mimeType='application/vnd.google-apps.script' and trashed=false",
+    "fields": "nextPageToken, files(id, name, createdTime, modifiedTime)",
+    "orderBy": "modifiedTime desc",
+}
+
+# Recently fetched project files, keyed by (user email, script ID).  The
+# Script API has no ETags, so entries simply expire after a short TTL and
+# are dropped whenever this server changes or deletes the project.
+_PROJECT_CACHE: "OrderedDict[tuple[str, str], tuple[float, list, dict]]" = OrderedDict()
+_PROJECT_CACHE_TTL = 60
+_PROJECT_CACHE_MAX_SIZE = 256
+
+
+async def _get_project_files(
+    service: Any, user_google_email: str, script_id: str
+) -> tuple[list, dict]:
+    """Fetch a project's files, reusing a copy fetched within the TTL.
+
+    Returns the file list and an index of it by name.  Both are shared with
+    the cache; callers must not mutate them.
+    """
+    cache_key = (user_google_email, script_id)
+    now = time.monotonic()
+    cached = _PROJECT_CACHE.get(cache_key)
+    if cached is not None:
+        fetched_at, files, files_by_name = cached
+        if now - fetched_at < _PROJECT_CACHE_TTL:
+            _PROJECT_CACHE.move_to_end(cache_key)
+            return files, files_by_name
+        del _PROJECT_CACHE[cache_key]
+
+    content = await run_blocking(
+        _collection(service, "projects")
+        .getContent(scriptId=script_id, fields=_PROJECT_FILES_FIELDS)
+        .execute
+    )
+    files = content.get("files", [])
+    files_by_name = {}
+    for file in files:
+        files_by_name.setdefault(file.get("name"), file)  # first match wins
+    _PROJECT_CACHE[cache_key] = (now, files, files_by_name)
+    if len(_PROJECT_CACHE) > _PROJECT_CACHE_MAX_SIZE:
+        _PROJECT_CACHE.popitem(last=False)
+    return files, files_by_name
+
+
+def _invalidate_project(user_google_email: str, script_id: str) -> None:
+    """Drop a cached project after it has been changed or deleted."""
+    _PROJECT_CACHE.pop((user_google_email, script_id), None)
+
+
+def clear_project_cache() -> None:
+    """Drop all cached projects."""
+    _PROJECT_CACHE.clear()
+
 
 # Internal implementation functions for testing
 async def _list_script_projects_impl(
@@ -74,21 +170,17 @@ async def _list_script_projects_impl(
     does not have a projects.list method.
     """
     logger.info(
-        f"[list_script_projects] Email: {user_google_email}, PageSize: {page_size}"
+        "[list_script_projects] Email: %s, PageSize: %s", user_google_email, page_size
     )
 
-    # Search for Apps Script files using Drive API
-    query = "mimeType='application/vnd.google-apps.script' and trashed=false"
-    request_params = {
-        "q": query,
-        "pageSize": page_size,
-        "fields": "nextPageToken, files(id, name, createdTime, modifiedTime)",
-        "orderBy": "modifiedTime desc",
-    }
+    request_params = _LIST_PROJECTS_PARAMS.copy()
+    request_params["pageSize"] = page_size
     if page_token:
         request_params["pageToken"] = page_token
 
-    response = await asyncio.to_thread(service.files().list(**request_params).execute)
+    response = await run_blocking(
+        _collection(service, "files").list(**request_params).execute
+    )
 
     files = response.get("files", [])
     next_page_token = response.get("nextPageToken")
@@ -99,31 +191,28 @@ async def _list_script_projects_impl(
         )
         return "No Apps Script projects found.", structured
 
-    output = [f"Found {len(files)} Apps Script projects:"]
-    project_summaries = []
-    for file in files:
-        title = file.get("name", "Untitled")
-        script_id = file.get("id", "Unknown ID")
-        create_time = file.get("createdTime", "Unknown")
-        update_time = file.get("modifiedTime", "Unknown")
-
-        output.append(
-            f"- {title} (ID: {script_id}) Created: {create_time} Modified: {update_time}"
-        )
-        project_summaries.append(
-            ScriptProjectSummary(
-                script_id=script_id,
-                title=title,
-                created_time=create_time,
-                modified_time=update_time,
-            )
+    project_summaries = [
+        ScriptProjectSummary(
+            script_id=file.get("id", "Unknown ID"),
+            title=file.get("name", "Untitled"),
+            created_time=file.get("createdTime", "Unknown"),
+            modified_time=file.get("modifiedTime", "Unknown"),
         )
+        for file in files
+    ]
+    output = [
+        f"Found {len(files)} Apps Script projects:",
+        *(
+            f"- {p.title} (ID: {p.script_id}) Created: {p.created_time} Modified: {p.modified_time}"
+            for p in project_summaries
+        ),
+    ]
 
     if next_page_token:
         output.append(f"\nNext page token: {next_page_token}")
 
     logger.info(
-        f"[list_script_projects] Found {len(files)} projects for {user_google_email}"
+        "[list_script_projects] Found %s projects for %s", len(files), user_google_email
     )
 
     structured = ListScriptProjectsResult(
@@ -167,17 +256,39 @@ async def _get_script_project_impl(
     service: Any,
     user_google_email: str,
     script_id: str,
+    include_source_preview: bool = False,
 ) -> tuple[str, GetScriptProjectResult]:
-    """Internal implementation for get_script_project."""
-    logger.info(f"[get_script_project] Email: {user_google_email}, ID: {script_id}")
+    """Internal implementation for get_script_project.
 
-    project = await asyncio.to_thread(
-        service.projects().get(scriptId=script_id).execute
+    Without source previews only file names and types are requested, so no
+    file sources are downloaded.
+    """
+    logger.info("[get_script_project] Email: %s, ID: %s", user_google_email, script_id)
+
+    async def _get_files() -> list:
+        if include_source_preview:
+            files, _ = await _get_project_files(service, user_google_email, script_id)
+            return files
+        content = await run_blocking(
+            _collection(service, "projects")
+            .getContent(scriptId=script_id, fields=_PROJECT_FILE_NAMES_FIELDS)
+            .execute
+        )
+        return content.get("files", [])
+
+    project, files = await asyncio.gather(
+        run_blocking(
+            _collection(service, "projects")
+            .get(scriptId=script_id, fields=_PROJECT_METADATA_FIELDS)
+            .execute
+        ),
+        _get_files(),
     )
 
     title = project.get("title", "Untitled")
     project_script_id = project.get("scriptId", "Unknown")
-    creator = project.get("creator", {}).get("email", "Unknown")
+    creator_info = project.get("creator")
+    creator = creator_info.get("email", "Unknown") if creator_info else "Unknown"
     create_time = project.get("createTime", "Unknown")
     update_time = project.get("updateTime", "Unknown")
 
@@ -190,7 +301,6 @@ async def _get_script_project_impl(
         "Files:",
     ]
 
-    files = project.get("files", [])
     script_files = []
     for i, file in enumerate(files, 1):
         file_name = file.get("name", "Untitled")
@@ -210,7 +320,7 @@ async def _get_script_project_impl(
             )
         )
 
-    logger.info(f"[get_script_project] Retrieved project {script_id}")
+    logger.info("[get_script_project] Retrieved project %s", script_id)
 
     structured = GetScriptProjectResult(
         script_id=project_script_id,
@@ -230,20 +340,24 @@ async def get_script_project(
     service: Any,
     user_google_email: str,
     script_id: str,
+    include_source_preview: bool = False,
 ) -> ToolResult:
     """
-    Retrieves complete project details including all source files.
+    Retrieves project details and the list of its files.
+
+    Use get_script_content to read a file's full source.
 
     Args:
 
 
         script_id: The script project ID
+        include_source_preview: Include the first 200 characters of each file's source (default: False)
 
     Returns:
-        ToolResult: Formatted project details with all file contents and structured data
+        ToolResult: Formatted project details with the file list and structured data
     """
     text, structured = await _get_script_project_impl(
-        service, user_google_email, script_id
+        service, user_google_email, script_id, include_source_preview
     )
     return create_tool_result(text=text, data=structured)
 
@@ -256,20 +370,14 @@ async def _get_script_content_impl(
 ) -> tuple[str, GetScriptContentResult]:
     """Internal implementation for get_script_content."""
     logger.info(
-        f"[get_script_content] Email: {user_google_email}, ID: {script_id}, File: {file_name}"
-    )
-
-    project = await asyncio.to_thread(
-        service.projects().get(scriptId=script_id).execute
+        "[get_script_content] Email: %s, ID: %s, File: %s",
+        user_google_email,
+        script_id,
+        file_name,
     )
 
-    files = project.get("files", [])
-    target_file = None
-
-    for file in files:
-        if file.get("name") == file_name:
-            target_file = file
-            break
+    _, files_by_name = await _get_project_files(service, user_google_email, script_id)
+    target_file = files_by_name.get(file_name)
 
     if not target_file:
         text = f"File '{file_name}' not found in project {script_id}"
@@ -287,7 +395,7 @@ async def _get_script_content_impl(
 
     output = [f"File: {file_name} ({file_type})", "", source]
 
-    logger.info(f"[get_script_content] Retrieved file {file_name} from {script_id}")
+    logger.info("[get_script_content] Retrieved file %s from %s", file_name, script_id)
 
     structured = GetScriptContentResult(
         script_id=script_id,
@@ -333,15 +441,17 @@ async def _create_script_project_impl(
     parent_id: Optional[str] = None,
 ) -> tuple[str, CreateScriptProjectResult]:
     """Internal implementation for create_script_project."""
-    logger.info(f"[create_script_project] Email: {user_google_email}, Title: {title}")
+    logger.info(
+        "[create_script_project] Email: %s, Title: %s", user_google_email, title
+    )
 
     request_body = {"title": title}
 
     if parent_id:
         request_body["parentId"] = parent_id
 
-    project = await asyncio.to_thread(
-        service.projects().create(body=request_body).execute
+    project = await run_blocking(
+        _collection(service, "projects").create(body=request_body).execute
     )
 
     script_id = project.get("scriptId", "Unknown")
@@ -353,7 +463,7 @@ async def _create_script_project_impl(
         f"Edit URL: {edit_url}",
     ]
 
-    logger.info(f"[create_script_project] Created project {script_id}")
+    logger.info("[create_script_project] Created project %s", script_id)
 
     structured = CreateScriptProjectResult(
         script_id=script_id,
@@ -398,14 +508,20 @@ async def _update_script_content_impl(
 ) -> tuple[str, UpdateScriptContentResult]:
     """Internal implementation for update_script_content."""
     logger.info(
-        f"[update_script_content] Email: {user_google_email}, ID: {script_id}, Files: {len(files)}"
+        "[update_script_content] Email: %s, ID: %s, Files: %s",
+        user_google_email,
+        script_id,
+        len(files),
     )
 
     request_body = {"files": files}
 
-    updated_content = await asyncio.to_thread(
-        service.projects().updateContent(scriptId=script_id, body=request_body).execute
+    updated_content = await run_blocking(
+        _collection(service, "projects")
+        .updateContent(scriptId=script_id, body=request_body)
+        .execute
     )
+    _invalidate_project(user_google_email, script_id)
 
     output = [f"Updated script project: {script_id}", "", "Modified files:"]
 
@@ -416,7 +532,7 @@ async def _update_script_content_impl(
         output.append(f"- {file_name} ({file_type})")
         updated_files.append(UpdatedFile(name=file_name, file_type=file_type))
 
-    logger.info(f"[update_script_content] Updated {len(files)} files in {script_id}")
+    logger.info("[update_script_content] Updated %s files in %s", len(files), script_id)
 
     structured = UpdateScriptContentResult(
         script_id=script_id,
@@ -463,7 +579,10 @@ async def _run_script_function_impl(
 ) -> tuple[str, RunScriptFunctionResult]:
     """Internal implementation for run_script_function."""
     logger.info(
-        f"[run_script_function] Email: {user_google_email}, ID: {script_id}, Function: {function_name}"
+        "[run_script_function] Email: %s, ID: %s, Function: %s",
+        user_google_email,
+        script_id,
+        function_name,
     )
 
     request_body = {"function": function_name, "devMode": dev_mode}
@@ -472,8 +591,10 @@ async def _run_script_function_impl(
         request_body["parameters"] = parameters
 
     try:
-        response = await asyncio.to_thread(
-            service.scripts().run(scriptId=script_id, body=request_body).execute
+        response = await run_blocking(
+            _collection(service, "scripts")
+            .run(scriptId=script_id, body=request_body)
+            .execute
         )
 
         if "error" in response:
@@ -489,14 +610,15 @@ async def _run_script_function_impl(
             )
             return text, structured
 
-        result = response.get("response", {}).get("result")
+        execution = response.get("response")
+        result = execution.get("result") if execution else None
         output = [
             "Execution successful",
             f"Function: {function_name}",
             f"Result: {result}",
         ]
 
-        logger.info(f"[run_script_function] Successfully executed {function_name}")
+        logger.info("[run_script_function] Successfully executed %s", function_name)
 
         structured = RunScriptFunctionResult(
             function_name=function_name,
@@ -506,7 +628,7 @@ async def _run_script_function_impl(
         return "\n".join(output), structured
 
     except Exception as e:
-        logger.error(f"[run_script_function] Execution error: {str(e)}")
+        logger.error("[run_script_function] Execution error: %s", e)
         text = f"Execution failed\nFunction: {function_name}\nError: {str(e)}"
         structured = RunScriptFunctionResult(
             function_name=function_name,
@@ -559,32 +681,36 @@ async def _create_deployment_impl(
     Creates a new version first, then creates a deployment using that version.
     """
     logger.info(
-        f"[create_deployment] Email: {user_google_email}, ID: {script_id}, Desc: {description}"
+        "[create_deployment] Email: %s, ID: %s, Desc: %s",
+        user_google_email,
+        script_id,
+        description,
     )
 
-    # First, create a new version
-    version_body = {"description": version_description or description}
-    version = await asyncio.to_thread(
-        service.projects()
-        .versions()
-        .create(scriptId=script_id, body=version_body)
-        .execute
-    )
-    version_number = version.get("versionNumber")
-    logger.info(f"[create_deployment] Created version {version_number}")
-
-    # Now create the deployment with the version number
-    deployment_body = {
-        "versionNumber": version_number,
-        "description": description,
-    }
+    def _create_version_and_deployment() -> tuple[Any, dict]:
+        # The deployment needs the new version number, so the two calls are
+        # sequential; running both in one worker thread saves a hand-off.
+        version_body = {"description": version_description or description}
+        version = (
+            _collection(service, "projects.versions")
+            .create(scriptId=script_id, body=version_body)
+            .execute()
+        )
+        version_number = version.get("versionNumber")
+        logger.info("[create_deployment] Created version %s", version_number)
+
+        deployment_body = {
+            "versionNumber": version_number,
+            "description": description,
+        }
+        deployment = (
+            _collection(service, "projects.deployments")
+            .create(scriptId=script_id, body=deployment_body)
+            .execute()
+        )
+        return version_number, deployment
 
-    deployment = await asyncio.to_thread(
-        service.projects()
-        .deployments()
-        .create(scriptId=script_id, body=deployment_body)
-        .execute
-    )
+    version_number, deployment = await run_blocking(_create_version_and_deployment)
 
     deployment_id = deployment.get("deploymentId", "Unknown")
 
@@ -595,7 +721,7 @@ async def _create_deployment_impl(
         f"Description: {description}",
     ]
 
-    logger.info(f"[create_deployment] Created deployment {deployment_id}")
+    logger.info("[create_deployment] Created deployment %s", deployment_id)
 
     structured = CreateDeploymentResult(
         script_id=script_id,
@@ -641,10 +767,10 @@ async def _list_deployments_impl(
     script_id: str,
 ) -> tuple[str, ListDeploymentsResult]:
     """Internal implementation for list_deployments."""
-    logger.info(f"[list_deployments] Email: {user_google_email}, ID: {script_id}")
+    logger.info("[list_deployments] Email: %s, ID: %s", user_google_email, script_id)
 
-    response = await asyncio.to_thread(
-        service.projects().deployments().list(scriptId=script_id).execute
+    response = await run_blocking(
+        _collection(service, "projects.deployments").list(scriptId=script_id).execute
     )
 
     deployments = response.get("deployments", [])
@@ -655,27 +781,24 @@ async def _list_deployments_impl(
         )
         return f"No deployments found for script: {script_id}", structured
 
-    output = [f"Deployments for script: {script_id}", ""]
-
-    deployment_summaries = []
-    for i, deployment in enumerate(deployments, 1):
-        deployment_id = deployment.get("deploymentId", "Unknown")
-        description = deployment.get("description", "No description")
-        update_time = deployment.get("updateTime", "Unknown")
-
-        output.append(f"{i}. {description} ({deployment_id})")
-        output.append(f"   Updated: {update_time}")
-        output.append("")
-
-        deployment_summaries.append(
-            DeploymentSummary(
-                deployment_id=deployment_id,
-                description=description,
-                update_time=update_time,
-            )
+    deployment_summaries = [
+        DeploymentSummary(
+            deployment_id=deployment.get("deploymentId", "Unknown"),
+            description=deployment.get("description", "No description"),
+            update_time=deployment.get("updateTime", "Unknown"),
         )
+        for deployment in deployments
+    ]
+    output = [
+        f"Deployments for script: {script_id}",
+        "",
+        *(
+            f"{i}. {d.description} ({d.deployment_id})\n   Updated: {d.update_time}\n"
+            for i, d in enumerate(deployment_summaries, 1)
+        ),
+    ]
 
-    logger.info(f"[list_deployments] Found {len(deployments)} deployments")
+    logger.info("[list_deployments] Found %s deployments", len(deployments))
 
     structured = ListDeploymentsResult(
         script_id=script_id,
@@ -719,16 +842,18 @@ async def _update_deployment_impl(
 ) -> tuple[str, UpdateDeploymentResult]:
     """Internal implementation for update_deployment."""
     logger.info(
-        f"[update_deployment] Email: {user_google_email}, Script: {script_id}, Deployment: {deployment_id}"
+        "[update_deployment] Email: %s, Script: %s, Deployment: %s",
+        user_google_email,
+        script_id,
+        deployment_id,
     )
 
     request_body = {}
     if description:
         request_body["description"] = description
 
-    deployment = await asyncio.to_thread(
-        service.projects()
-        .deployments()
+    deployment = await run_blocking(
+        _collection(service, "projects.deployments")
         .update(scriptId=script_id, deploymentId=deployment_id, body=request_body)
         .execute
     )
@@ -741,7 +866,7 @@ async def _update_deployment_impl(
         f"Description: {final_description}",
     ]
 
-    logger.info(f"[update_deployment] Updated deployment {deployment_id}")
+    logger.info("[update_deployment] Updated deployment %s", deployment_id)
 
     structured = UpdateDeploymentResult(
         script_id=script_id,
@@ -788,19 +913,21 @@ async def _delete_deployment_impl(
 ) -> tuple[str, DeleteDeploymentResult]:
     """Internal implementation for delete_deployment."""
     logger.info(
-        f"[delete_deployment] Email: {user_google_email}, Script: {script_id}, Deployment: {deployment_id}"
+        "[delete_deployment] Email: %s, Script: %s, Deployment: %s",
+        user_google_email,
+        script_id,
+        deployment_id,
     )
 
-    await asyncio.to_thread(
-        service.projects()
-        .deployments()
+    await run_blocking(
+        _collection(service, "projects.deployments")
         .delete(scriptId=script_id, deploymentId=deployment_id)
         .execute
     )
 
     output = f"Deleted deployment: {deployment_id} from script: {script_id}"
 
-    logger.info(f"[delete_deployment] Deleted deployment {deployment_id}")
+    logger.info("[delete_deployment] Deleted deployment %s", deployment_id)
 
     structured = DeleteDeploymentResult(
         script_id=script_id,
@@ -845,15 +972,15 @@ async def _list_script_processes_impl(
 ) -> tuple[str, ListScriptProcessesResult]:
     """Internal implementation for list_script_processes."""
     logger.info(
-        f"[list_script_processes] Email: {user_google_email}, PageSize: {page_size}"
+        "[list_script_processes] Email: %s, PageSize: %s", user_google_email, page_size
     )
 
     request_params = {"pageSize": page_size}
     if script_id:
         request_params["scriptId"] = script_id
 
-    response = await asyncio.to_thread(
-        service.processes().list(**request_params).execute
+    response = await run_blocking(
+        _collection(service, "processes").list(**request_params).execute
     )
 
     processes = response.get("processes", [])
@@ -864,31 +991,28 @@ async def _list_script_processes_impl(
         )
         return "No recent script executions found.", structured
 
-    output = ["Recent script executions:", ""]
-
-    process_summaries = []
-    for i, process in enumerate(processes, 1):
-        function_name = process.get("functionName", "Unknown")
-        process_status = process.get("processStatus", "Unknown")
-        start_time = process.get("startTime", "Unknown")
-        duration = process.get("duration", "Unknown")
-
-        output.append(f"{i}. {function_name}")
-        output.append(f"   Status: {process_status}")
-        output.append(f"   Started: {start_time}")
-        output.append(f"   Duration: {duration}")
-        output.append("")
-
-        process_summaries.append(
-            ProcessSummary(
-                function_name=function_name,
-                process_status=process_status,
-                start_time=start_time,
-                duration=duration,
-            )
+    process_summaries = [
+        ProcessSummary(
+            function_name=process.get("functionName", "Unknown"),
+            process_status=process.get("processStatus", "Unknown"),
+            start_time=process.get("startTime", "Unknown"),
+            duration=process.get("duration", "Unknown"),
         )
+        for process in processes
+    ]
+    output = [
+        "Recent script executions:",
+        "",
+        *(
+            f"{i}. {p.function_name}\n"
+            f"   Status: {p.process_status}\n"
+            f"   Started: {p.start_time}\n"
+            f"   Duration: {p.duration}\n"
+            for i, p in enumerate(process_summaries, 1)
+        ),
+    ]
 
-    logger.info(f"[list_script_processes] Found {len(processes)} processes")
+    logger.info("[list_script_processes] Found %s processes", len(processes))
 
     structured = ListScriptProcessesResult(
         total_found=len(process_summaries),
@@ -937,13 +1061,14 @@ async def _delete_script_project_impl(
 ) -> tuple[str, DeleteScriptProjectResult]:
     """Internal implementation for delete_script_project."""
     logger.info(
-        f"[delete_script_project] Email: {user_google_email}, ScriptID: {script_id}"
+        "[delete_script_project] Email: %s, ScriptID: %s", user_google_email, script_id
     )
 
     # Apps Script projects are stored as Drive files
-    await asyncio.to_thread(service.files().delete(fileId=script_id).execute)
+    await run_blocking(_collection(service, "files").delete(fileId=script_id).execute)
+    _invalidate_project(user_google_email, script_id)
 
-    logger.info(f"[delete_script_project] Deleted script {script_id}")
+    logger.info("[delete_script_project] Deleted script %s", script_id)
 
     structured = DeleteScriptProjectResult(script_id=script_id, deleted=True)
     return f"Deleted Apps Script project: {script_id}", structured
@@ -987,10 +1112,10 @@ async def _list_versions_impl(
     script_id: str,
 ) -> tuple[str, ListVersionsResult]:
     """Internal implementation for list_versions."""
-    logger.info(f"[list_versions] Email: {user_google_email}, ScriptID: {script_id}")
+    logger.info("[list_versions] Email: %s, ScriptID: %s", user_google_email, script_id)
 
-    response = await asyncio.to_thread(
-        service.projects().versions().list(scriptId=script_id).execute
+    response = await run_blocking(
+        _collection(service, "projects.versions").list(scriptId=script_id).execute
     )
 
     versions = response.get("versions", [])
@@ -999,34 +1124,27 @@ async def _list_versions_impl(
         structured = ListVersionsResult(script_id=script_id, total_found=0, versions=[])
         return f"No versions found for script: {script_id}", structured
 
-    output = [f"Versions for script: {script_id}", ""]
-
-    version_summaries = []
-    for version in versions:
-        version_number = version.get("versionNumber", "Unknown")
-        description = version.get("description", "No description")
-        create_time = version.get("createTime", "Unknown")
-
-        output.append(f"Version {version_number}: {description}")
-        output.append(f"   Created: {create_time}")
-        output.append("")
-
-        version_summaries.append(
-            VersionSummary(
-                version_number=version_number,
-                description=description,
-                create_time=create_time,
-            )
+    version_summaries = [
+        VersionSummary(
+            version_number=version.get("versionNumber", "Unknown"),
+            description=version.get("description", "No description"),
+            create_time=version.get("createTime", "Unknown"),
         )
+        for version in versions
+    ]
+    text = f"Versions for script: {script_id}\n\n" + "\n".join(
+        f"Version {v.version_number}: {v.description}\n   Created: {v.create_time}\n"
+        for v in version_summaries
+    )
 
-    logger.info(f"[list_versions] Found {len(versions)} versions")
+    logger.info("[list_versions] Found %s versions", len(versions))
 
     structured = ListVersionsResult(
         script_id=script_id,
         total_found=len(version_summaries),
         versions=version_summaries,
     )
-    return "\n".join(output), structured
+    return text, structured
 
 
 @server.tool(output_schema=LIST_VERSIONS_SCHEMA)
@@ -1062,15 +1180,16 @@ async def _create_version_impl(
     description: Optional[str] = None,
 ) -> tuple[str, CreateVersionResult]:
     """Internal implementation for create_version."""
-    logger.info(f"[create_version] Email: {user_google_email}, ScriptID: {script_id}")
+    logger.info(
+        "[create_version] Email: %s, ScriptID: %s", user_google_email, script_id
+    )
 
     request_body = {}
     if description:
         request_body["description"] = description
 
-    version = await asyncio.to_thread(
-        service.projects()
-        .versions()
+    version = await run_blocking(
+        _collection(service, "projects.versions")
         .create(scriptId=script_id, body=request_body)
         .execute
     )
@@ -1085,7 +1204,7 @@ async def _create_version_impl(
         f"Created: {create_time}",
     ]
 
-    logger.info(f"[create_version] Created version {version_number}")
+    logger.info("[create_version] Created version %s", version_number)
 
     structured = CreateVersionResult(
         script_id=script_id,
@@ -1134,12 +1253,14 @@ async def _get_version_impl(
 ) -> tuple[str, GetVersionResult]:
     """Internal implementation for get_version."""
     logger.info(
-        f"[get_version] Email: {user_google_email}, ScriptID: {script_id}, Version: {version_number}"
+        "[get_version] Email: %s, ScriptID: %s, Version: %s",
+        user_google_email,
+        script_id,
+        version_number,
     )
 
-    version = await asyncio.to_thread(
-        service.projects()
-        .versions()
+    version = await run_blocking(
+        _collection(service, "projects.versions")
         .get(scriptId=script_id, versionNumber=version_number)
         .execute
     )
@@ -1154,7 +1275,7 @@ async def _get_version_impl(
         f"Created: {create_time}",
     ]
 
-    logger.info(f"[get_version] Retrieved version {ver_num}")
+    logger.info("[get_version] Retrieved version %s", ver_num)
 
     structured = GetVersionResult(
         script_id=script_id,
@@ -1192,11 +1313,145 @@ async def get_version(
     return create_tool_result(text=text, data=structured)
 
 
+# Upper bound on concurrent versions.get calls, to stay under per-minute quota
+_VERSION_FETCH_CONCURRENCY = 8
+
+
+async def _list_version_numbers(service: Any, script_id: str) -> List[int]:
+    """Return every version number of a script, following pagination."""
+    numbers: List[int] = []
+    params: Dict[str, Any] = {"scriptId": script_id}
+    while True:
+        response = await run_blocking(
+            _collection(service, "projects.versions").list(**params).execute
+        )
+        numbers.extend(
+            version["versionNumber"]
+            for version in response.get("versions", [])
+            if "versionNumber" in version
+        )
+        next_page_token = response.get("nextPageToken")
+        if not next_page_token:
+            return numbers
+        params["pageToken"] = next_page_token
+
+
+async def _get_versions_impl(
+    service: Any,
+    user_google_email: str,
+    script_id: str,
+    version_numbers: Optional[List[int]] = None,
+) -> tuple[str, GetVersionsResult]:
+    """Internal implementation for get_versions.
+
+    Fetches the versions concurrently, at most ``_VERSION_FETCH_CONCURRENCY``
+    at a time; every version of the script is fetched when
+    ``version_numbers`` is omitted.  A version the API rejects is reported
+    in the output; any other error is raised.
+    """
+    if version_numbers is None:
+        version_numbers = await _list_version_numbers(service, script_id)
+
+    semaphore = asyncio.Semaphore(_VERSION_FETCH_CONCURRENCY)
+
+    async def _bounded_get(number: int) -> tuple[str, GetVersionResult]:
+        async with semaphore:
+            return await _get_version_impl(
+                service, user_google_email, script_id, number
+            )
+
+    results = await asyncio.gather(
+        *(_bounded_get(number) for number in version_numbers),
+        return_exceptions=True,
+    )
+
+    output = []
+    versions = []
+    failed_versions = []
+    for number, result in zip(version_numbers, results):
+        if isinstance(result, HttpError):
+            output.append(f"Version {number} of script: {script_id}\nError: {result}")
+            failed_versions.append(number)
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            text, version = result
+            output.append(text)
+            versions.append(version)
+
+    structured = GetVersionsResult(
+        script_id=script_id,
+        total_found=len(versions),
+        versions=versions,
+        failed_versions=failed_versions,
+    )
+    if not output:
+        return f"No versions found for script: {script_id}", structured
+    return "\n\n".join(output), structured
+
+
+@server.tool(output_schema=GET_VERSIONS_SCHEMA)
+@handle_http_errors("get_versions", is_read_only=True, service_type="script")
+@require_google_service("script", "script_readonly")
+async def get_versions(
+    service: Any,
+    user_google_email: str,
+    script_id: str,
+    version_numbers: Optional[List[int]] = None,
+) -> ToolResult:
+    """
+    Gets details of several versions in one call.
+
+    Args:
+
+
+        script_id: The script project ID
+        version_numbers: The version numbers to retrieve (e.g. [1, 2, 3]).
+                         Omit to retrieve every version of the script.
+
+    Returns:
+        ToolResult: Formatted string with each version's details and structured data
+    """
+    text, structured = await _get_versions_impl(
+        service, user_google_email, script_id, version_numbers
+    )
+    return create_tool_result(text=text, data=structured)
+
+
 # ============================================================================
 # Metrics
 # ============================================================================
 
 
+# (response key, heading, unit) for each series returned by projects.getMetrics
+_METRIC_SERIES = (
+    ("activeUsers", "Active Users", "users"),
+    ("totalExecutions", "Total Executions", "executions"),
+    ("failedExecutions", "Failed Executions", "failures"),
+)
+
+_POINT_FIELDS = operator.itemgetter("startTime", "endTime", "value")
+
+
+def _metric_rows(points: List[Dict[str, Any]]) -> List[tuple]:
+    """Return ``(start, end, value)`` for each metric point.
+
+    Points normally carry all three keys, so a single ``itemgetter`` pass
+    is tried first; the per-key defaults are only applied when one is missing.
+    """
+    try:
+        return list(map(_POINT_FIELDS, points))
+    except KeyError:
+        return [
+            (
+                point.get("startTime", "Unknown"),
+                point.get("endTime", "Unknown"),
+                point.get("value", "0"),
+            )
+            for point in points
+        ]
+
+
 async def _get_script_metrics_impl(
     service: Any,
     user_google_email: str,
@@ -1205,7 +1460,10 @@ async def _get_script_metrics_impl(
 ) -> tuple[str, GetScriptMetricsResult]:
     """Internal implementation for get_script_metrics."""
     logger.info(
-        f"[get_script_metrics] Email: {user_google_email}, ScriptID: {script_id}, Granularity: {metrics_granularity}"
+        "[get_script_metrics] Email: %s, ScriptID: %s, Granularity: %s",
+        user_google_email,
+        script_id,
+        metrics_granularity,
     )
 
     request_params = {
@@ -1213,8 +1471,8 @@ async def _get_script_metrics_impl(
         "metricsGranularity": metrics_granularity,
     }
 
-    response = await asyncio.to_thread(
-        service.projects().getMetrics(**request_params).execute
+    response = await run_blocking(
+        _collection(service, "projects").getMetrics(**request_params).execute
     )
 
     output = [
@@ -1223,62 +1481,31 @@ async def _get_script_metrics_impl(
         "",
     ]
 
-    # Active users
-    active_users = response.get("activeUsers", [])
-    active_users_data = []
-    if active_users:
-        output.append("Active Users:")
-        for metric in active_users:
-            start_time = metric.get("startTime", "Unknown")
-            end_time = metric.get("endTime", "Unknown")
-            value = metric.get("value", "0")
-            output.append(f"  {start_time} to {end_time}: {value} users")
-            active_users_data.append(
-                MetricDataPoint(start_time=start_time, end_time=end_time, value=value)
+    series = {}
+    for key, label, unit in _METRIC_SERIES:
+        rows = _metric_rows(response.get(key, []))
+        if rows:
+            output.append(f"{label}:")
+            output.extend(
+                f"  {start} to {end}: {value} {unit}" for start, end, value in rows
             )
-        output.append("")
-
-    # Total executions
-    total_executions = response.get("totalExecutions", [])
-    total_executions_data = []
-    if total_executions:
-        output.append("Total Executions:")
-        for metric in total_executions:
-            start_time = metric.get("startTime", "Unknown")
-            end_time = metric.get("endTime", "Unknown")
-            value = metric.get("value", "0")
-            output.append(f"  {start_time} to {end_time}: {value} executions")
-            total_executions_data.append(
-                MetricDataPoint(start_time=start_time, end_time=end_time, value=value)
-            )
-        output.append("")
-
-    # Failed executions
-    failed_executions = response.get("failedExecutions", [])
-    failed_executions_data = []
-    if failed_executions:
-        output.append("Failed Executions:")
-        for metric in failed_executions:
-            start_time = metric.get("startTime", "Unknown")
-            end_time = metric.get("endTime", "Unknown")
-            value = metric.get("value", "0")
-            output.append(f"  {start_time} to {end_time}: {value} failures")
-            failed_executions_data.append(
-                MetricDataPoint(start_time=start_time, end_time=end_time, value=value)
-            )
-        output.append("")
+            output.append("")
+        start_times, end_times, values = map(list, zip(*rows)) if rows else ([], [], [])
+        series[key] = MetricSeries(
+            start_times=start_times, end_times=end_times, values=values
+        )
 
-    if not active_users and not total_executions and not failed_executions:
+    if not any(series[key].values for key, _, _ in _METRIC_SERIES):
         output.append("No metrics data available for this script.")
 
-    logger.info(f"[get_script_metrics] Retrieved metrics for {script_id}")
+    logger.info("[get_script_metrics] Retrieved metrics for %s", script_id)
 
     structured = GetScriptMetricsResult(
         script_id=script_id,
         granularity=metrics_granularity,
-        active_users=active_users_data,
-        total_executions=total_executions_data,
-        failed_executions=failed_executions_data,
+        active_users=series["activeUsers"],
+        total_executions=series["totalExecutions"],
+        failed_executions=series["failedExecutions"],
     )
     return "\n".join(output), structured
 
@@ -1318,168 +1545,208 @@ async def get_script_metrics(
 # ============================================================================
 
 
-def _generate_trigger_code_impl(
-    trigger_type: str,
-    function_name: str,
-    schedule: str = "",
-) -> tuple[str, GenerateTriggerCodeResult]:
-    """Internal implementation for generate_trigger_code."""
-    code_lines = []
-    is_simple_trigger = False
-
-    if trigger_type == "on_open":
-        is_simple_trigger = True
-        code_lines = [
-            "// Simple trigger - just rename your function to 'onOpen'",
-            "// This runs automatically when the document is opened",
-            "function onOpen(e) {",
-            f"  {function_name}();",
-            "}",
-        ]
-    elif trigger_type == "on_edit":
-        is_simple_trigger = True
-        code_lines = [
-            "// Simple trigger - just rename your function to 'onEdit'",
-            "// This runs automatically when a user edits the spreadsheet",
-            "function onEdit(e) {",
-            f"  {function_name}();",
-            "}",
+def _simple_trigger_template(handler: str, event: str) -> str:
+    """Build the format template for a simple trigger."""
+    return "\n".join(
+        [
+            f"// Simple trigger - just rename your function to '{handler}'",
+            f"// This runs automatically when {event}",
+            f"function {handler}(e) {{{{",
+            "  {function_name}();",
+            "}}",
         ]
-    elif trigger_type == "time_minutes":
-        interval = schedule or "5"
-        code_lines = [
-            "// Run this function ONCE to install the trigger",
-            f"function createTimeTrigger_{function_name}() {{",
-            "  // Delete existing triggers for this function first",
-            "  const triggers = ScriptApp.getProjectTriggers();",
-            "  triggers.forEach(trigger => {",
-            f"    if (trigger.getHandlerFunction() === '{function_name}') {{",
-            "      ScriptApp.deleteTrigger(trigger);",
-            "    }",
-            "  });",
-            "",
-            f"  // Create new trigger - runs every {interval} minutes",
-            f"  ScriptApp.newTrigger('{function_name}')",
-            "    .timeBased()",
-            f"    .everyMinutes({interval})",
-            "    .create();",
-            "",
-            f"  Logger.log('Trigger created: {function_name} will run every {interval} minutes');",
-            "}",
-        ]
-    elif trigger_type == "time_hours":
-        interval = schedule or "1"
-        code_lines = [
-            "// Run this function ONCE to install the trigger",
-            f"function createTimeTrigger_{function_name}() {{",
-            "  // Delete existing triggers for this function first",
-            "  const triggers = ScriptApp.getProjectTriggers();",
-            "  triggers.forEach(trigger => {",
-            f"    if (trigger.getHandlerFunction() === '{function_name}') {{",
-            "      ScriptApp.deleteTrigger(trigger);",
-            "    }",
-            "  });",
-            "",
-            f"  // Create new trigger - runs every {interval} hour(s)",
-            f"  ScriptApp.newTrigger('{function_name}')",
-            "    .timeBased()",
-            f"    .everyHours({interval})",
-            "    .create();",
-            "",
-            f"  Logger.log('Trigger created: {function_name} will run every {interval} hour(s)');",
-            "}",
-        ]
-    elif trigger_type == "time_daily":
-        hour = schedule or "9"
-        code_lines = [
-            "// Run this function ONCE to install the trigger",
-            f"function createDailyTrigger_{function_name}() {{",
-            "  // Delete existing triggers for this function first",
-            "  const triggers = ScriptApp.getProjectTriggers();",
-            "  triggers.forEach(trigger => {",
-            f"    if (trigger.getHandlerFunction() === '{function_name}') {{",
-            "      ScriptApp.deleteTrigger(trigger);",
-            "    }",
-            "  });",
-            "",
-            f"  // Create new trigger - runs daily at {hour}:00",
-            f"  ScriptApp.newTrigger('{function_name}')",
-            "    .timeBased()",
-            f"    .atHour({hour})",
-            "    .everyDays(1)",
-            "    .create();",
-            "",
-            f"  Logger.log('Trigger created: {function_name} will run daily at {hour}:00');",
-            "}",
-        ]
-    elif trigger_type == "time_weekly":
-        day = schedule.upper() if schedule else "MONDAY"
-        code_lines = [
-            "// Run this function ONCE to install the trigger",
-            f"function createWeeklyTrigger_{function_name}() {{",
-            "  // Delete existing triggers for this function first",
-            "  const triggers = ScriptApp.getProjectTriggers();",
-            "  triggers.forEach(trigger => {",
-            f"    if (trigger.getHandlerFunction() === '{function_name}') {{",
-            "      ScriptApp.deleteTrigger(trigger);",
-            "    }",
-            "  });",
-            "",
-            f"  // Create new trigger - runs weekly on {day}",
-            f"  ScriptApp.newTrigger('{function_name}')",
-            "    .timeBased()",
-            f"    .onWeekDay(ScriptApp.WeekDay.{day})",
-            "    .atHour(9)",
-            "    .create();",
-            "",
-            f"  Logger.log('Trigger created: {function_name} will run every {day} at 9:00');",
-            "}",
-        ]
-    elif trigger_type == "on_form_submit":
-        code_lines = [
-            "// Run this function ONCE to install the trigger",
-            "// This must be run from a script BOUND to the Google Form",
-            f"function createFormSubmitTrigger_{function_name}() {{",
-            "  // Delete existing triggers for this function first",
-            "  const triggers = ScriptApp.getProjectTriggers();",
-            "  triggers.forEach(trigger => {",
-            f"    if (trigger.getHandlerFunction() === '{function_name}') {{",
-            "      ScriptApp.deleteTrigger(trigger);",
-            "    }",
-            "  });",
-            "",
-            "  // Create new trigger - runs when form is submitted",
-            f"  ScriptApp.newTrigger('{function_name}')",
-            "    .forForm(FormApp.getActiveForm())",
-            "    .onFormSubmit()",
-            "    .create();",
-            "",
-            f"  Logger.log('Trigger created: {function_name} will run on form submit');",
-            "}",
-        ]
-    elif trigger_type == "on_change":
-        code_lines = [
+    )
+
+
+def _installable_trigger_template(
+    setup_name: str,
+    notes: List[str],
+    comment: str,
+    builder: List[str],
+    log_suffix: str,
+) -> str:
+    """Build the format template for an installable trigger's setup function.
+
+    The template takes ``{function_name}`` and ``{schedule}``; braces in the
+    generated JavaScript are doubled.
+    """
+    return "\n".join(
+        [
             "// Run this function ONCE to install the trigger",
-            "// This must be run from a script BOUND to a Google Sheet",
-            f"function createChangeTrigger_{function_name}() {{",
+            *notes,
+            f"function {setup_name}_{{function_name}}() {{{{",
             "  // Delete existing triggers for this function first",
             "  const triggers = ScriptApp.getProjectTriggers();",
-            "  triggers.forEach(trigger => {",
-            f"    if (trigger.getHandlerFunction() === '{function_name}') {{",
+            "  triggers.forEach(trigger => {{",
+            "    if (trigger.getHandlerFunction() === '{function_name}') {{",
             "      ScriptApp.deleteTrigger(trigger);",
-            "    }",
-            "  });",
+            "    }}",
+            "  }});",
             "",
-            "  // Create new trigger - runs when spreadsheet changes",
-            f"  ScriptApp.newTrigger('{function_name}')",
-            "    .forSpreadsheet(SpreadsheetApp.getActive())",
-            "    .onChange()",
+            f"  // Create new trigger - {comment}",
+            "  ScriptApp.newTrigger('{function_name}')",
+            *builder,
             "    .create();",
             "",
-            f"  Logger.log('Trigger created: {function_name} will run on spreadsheet change');",
-            "}",
+            f"  Logger.log('Trigger created: {{function_name}} will run {log_suffix}');",
+            "}}",
         ]
-    else:
+    )
+
+
+_SIMPLE_TRIGGER_HEADER = "\n".join(
+    [
+        "SIMPLE TRIGGER",
+        "=" * 50,
+        "",
+        "Add this code to your script. Simple triggers run automatically",
+        "when the event occurs - no setup function needed.",
+        "",
+        "Note: Simple triggers have limitations:",
+        "- Cannot access services that require authorization",
+        "- Cannot run longer than 30 seconds",
+        "- Cannot make external HTTP requests",
+        "",
+        "For more capabilities, use an installable trigger instead.",
+        "",
+        "CODE TO ADD:",
+        "-" * 50,
+    ]
+)
+
+_EVENT_TRIGGER_HEADER = "\n".join(
+    [
+        "INSTALLABLE TRIGGER",
+        "=" * 50,
+        "",
+        "1. Add this code to your script",
+        "2. Run the setup function once: createFormSubmitTrigger_{function_name}() or similar",
+        "3. The trigger will then run automatically",
+        "",
+        "CODE TO ADD:",
+        "-" * 50,
+    ]
+)
+
+_TIME_TRIGGER_HEADER = "\n".join(
+    [
+        "INSTALLABLE TRIGGER",
+        "=" * 50,
+        "",
+        "1. Add this code to your script using update_script_content",
+        "2. Run the setup function ONCE (manually in Apps Script editor or via run_script_function)",
+        "3. The trigger will then run automatically on schedule",
+        "",
+        "To check installed triggers: Apps Script editor > Triggers (clock icon)",
+        "",
+        "CODE TO ADD:",
+        "-" * 50,
+    ]
+)
+
+
+# trigger_type -> (code template, instructions header, default schedule,
+# is simple trigger)
+_TRIGGER_TEMPLATES: Dict[str, tuple[str, str, str, bool]] = {
+    "on_open": (
+        _simple_trigger_template("onOpen", "the document is opened"),
+        _SIMPLE_TRIGGER_HEADER,
+        "",
+        True,
+    ),
+    "on_edit": (
+        _simple_trigger_template("onEdit", "a user edits the spreadsheet"),
+        _SIMPLE_TRIGGER_HEADER,
+        "",
+        True,
+    ),
+    "time_minutes": (
+        _installable_trigger_template(
+            "createTimeTrigger",
+            [],
+            "runs every {schedule} minutes",
+            ["    .timeBased()", "    .everyMinutes({schedule})"],
+            "every {schedule} minutes",
+        ),
+        _TIME_TRIGGER_HEADER,
+        "5",
+        False,
+    ),
+    "time_hours": (
+        _installable_trigger_template(
+            "createTimeTrigger",
+            [],
+            "runs every {schedule} hour(s)",
+            ["    .timeBased()", "    .everyHours({schedule})"],
+            "every {schedule} hour(s)",
+        ),
+        _TIME_TRIGGER_HEADER,
+        "1",
+        False,
+    ),
+    "time_daily": (
+        _installable_trigger_template(
+            "createDailyTrigger",
+            [],
+            "runs daily at {schedule}:00",
+            ["    .timeBased()", "    .atHour({schedule})", "    .everyDays(1)"],
+            "daily at {schedule}:00",
+        ),
+        _TIME_TRIGGER_HEADER,
+        "9",
+        False,
+    ),
+    "time_weekly": (
+        _installable_trigger_template(
+            "createWeeklyTrigger",
+            [],
+            "runs weekly on {schedule}",
+            [
+                "    .timeBased()",
+                "    .onWeekDay(ScriptApp.WeekDay.{schedule})",
+                "    .atHour(9)",
+            ],
+            "every {schedule} at 9:00",
+        ),
+        _TIME_TRIGGER_HEADER,
+        "MONDAY",
+        False,
+    ),
+    "on_form_submit": (
+        _installable_trigger_template(
+            "createFormSubmitTrigger",
+            ["// This must be run from a script BOUND to the Google Form"],
+            "runs when form is submitted",
+            ["    .forForm(FormApp.getActiveForm())", "    .onFormSubmit()"],
+            "on form submit",
+        ),
+        _EVENT_TRIGGER_HEADER,
+        "",
+        False,
+    ),
+    "on_change": (
+        _installable_trigger_template(
+            "createChangeTrigger",
+            ["// This must be run from a script BOUND to a Google Sheet"],
+            "runs when spreadsheet changes",
+            ["    .forSpreadsheet(SpreadsheetApp.getActive())", "    .onChange()"],
+            "on spreadsheet change",
+        ),
+        _EVENT_TRIGGER_HEADER,
+        "",
+        False,
+    ),
+}
+
+
+def _generate_trigger_code_impl(
+    trigger_type: str,
+    function_name: str,
+    schedule: str = "",
+) -> tuple[str, GenerateTriggerCodeResult]:
+    """Internal implementation for generate_trigger_code."""
+    template_info = _TRIGGER_TEMPLATES.get(trigger_type)
+    if template_info is None:
         error_text = (
             f"Unknown trigger type: {trigger_type}\n\n"
             "Valid types: time_minutes, time_hours, time_daily, time_weekly, "
@@ -1494,56 +1761,13 @@ def _generate_trigger_code_impl(
         )
         return error_text, structured
 
-    code = "\n".join(code_lines)
-
-    instructions = []
-    if trigger_type.startswith("on_"):
-        if trigger_type in ("on_open", "on_edit"):
-            instructions = [
-                "SIMPLE TRIGGER",
-                "=" * 50,
-                "",
-                "Add this code to your script. Simple triggers run automatically",
-                "when the event occurs - no setup function needed.",
-                "",
-                "Note: Simple triggers have limitations:",
-                "- Cannot access services that require authorization",
-                "- Cannot run longer than 30 seconds",
-                "- Cannot make external HTTP requests",
-                "",
-                "For more capabilities, use an installable trigger instead.",
-                "",
-                "CODE TO ADD:",
-                "-" * 50,
-            ]
-        else:
-            instructions = [
-                "INSTALLABLE TRIGGER",
-                "=" * 50,
-                "",
-                "1. Add this code to your script",
-                f"2. Run the setup function once: createFormSubmitTrigger_{function_name}() or similar",
-                "3. The trigger will then run automatically",
-                "",
-                "CODE TO ADD:",
-                "-" * 50,
-            ]
-    else:
-        instructions = [
-            "INSTALLABLE TRIGGER",
-            "=" * 50,
-            "",
-            "1. Add this code to your script using update_script_content",
-            "2. Run the setup function ONCE (manually in Apps Script editor or via run_script_function)",
-            "3. The trigger will then run automatically on schedule",
-            "",
-            "To check installed triggers: Apps Script editor > Triggers (clock icon)",
-            "",
-            "CODE TO ADD:",
-            "-" * 50,
-        ]
+    template, header, default_schedule, is_simple_trigger = template_info
+    schedule_value = schedule or default_schedule
+    if trigger_type == "time_weekly":
+        schedule_value = schedule_value.upper()
+    code = template.format(function_name=function_name, schedule=schedule_value)
 
-    text = "\n".join(instructions) + "\n\n" + code
+    text = header.format(function_name=function_name) + "\n\n" + code
     structured = GenerateTriggerCodeResult(
         trigger_type=trigger_type,
         function_name=function_name,
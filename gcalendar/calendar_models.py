@@ -11,7 +11,7 @@ from typing import Optional
 from core.structured_output import generate_schema
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarInfo:
     """Information about a single calendar."""
 
@@ -20,7 +20,7 @@ class CalendarInfo:
     is_primary: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarListResult:
     """Structured result from list_calendars."""
 
@@ -28,7 +28,7 @@ class CalendarListResult:
     calendars: list[CalendarInfo]
 
 
-@dataclass
+@dataclass(slots=True)
 class EventAttendee:
     """Information about an event attendee."""
 
@@ -38,7 +38,7 @@ class EventAttendee:
     is_optional: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class EventAttachment:
     """Information about an event attachment."""
 
@@ -48,7 +48,7 @@ class EventAttachment:
     mime_type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarEvent:
     """Information about a single calendar event."""
 
@@ -64,7 +64,7 @@ class CalendarEvent:
     attachments: list[EventAttachment] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GetEventsResult:
     """Structured result from get_events."""
 
@@ -73,7 +73,7 @@ class GetEventsResult:
     events: list[CalendarEvent]
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateEventResult:
     """Structured result from create_event."""
 
@@ -83,7 +83,7 @@ class CreateEventResult:
     google_meet_link: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ModifyEventResult:
     """Structured result from modify_event."""
 
@@ -94,7 +94,7 @@ class ModifyEventResult:
     google_meet_removed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteEventResult:
     """Structured result from delete_event."""
 
@@ -102,7 +102,7 @@ class DeleteEventResult:
     calendar_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BusyPeriod:
     """A busy time period."""
 
@@ -110,7 +110,7 @@ class BusyPeriod:
     end: str
 
 
-@dataclass
+@dataclass(slots=True)
 class CalendarFreeBusy:
     """Free/busy information for a single calendar."""
 
@@ -119,7 +119,7 @@ class CalendarFreeBusy:
     errors: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class FreeBusyResult:
     """Structured result from query_freebusy."""
 
@@ -69,24 +69,28 @@ def _parse_reminders_json(
             reminders = json.loads(reminders_input)
             if not isinstance(reminders, list):
                 logger.warning(
-                    f"[{function_name}] Reminders must be a JSON array, got {type(reminders).__name__}"
+                    "[%s] Reminders must be a JSON array, got %s",
+                    function_name,
+                    type(reminders).__name__,
                 )
                 return []
         except json.JSONDecodeError as e:
-            logger.warning(f"[{function_name}] Invalid JSON for reminders: {e}")
+            logger.warning("[%s] Invalid JSON for reminders: %s", function_name, e)
             return []
     elif isinstance(reminders_input, list):
         reminders = reminders_input
     else:
         logger.warning(
-            f"[{function_name}] Reminders must be a JSON string or list, got {type(reminders_input).__name__}"
+            "[%s] Reminders must be a JSON string or list, got %s",
+            function_name,
+            type(reminders_input).__name__,
         )
         return []
 
     # Validate reminders
     if len(reminders) > 5:
         logger.warning(
-            f"[{function_name}] More than 5 reminders provided, truncating to first 5"
+            "[%s] More than 5 reminders provided, truncating to first 5", function_name
         )
         reminders = reminders[:5]
 
@@ -98,21 +102,25 @@ def _parse_reminders_json(
             or "minutes" not in reminder
         ):
             logger.warning(
-                f"[{function_name}] Invalid reminder format: {reminder}, skipping"
+                "[%s] Invalid reminder format: %s, skipping", function_name, reminder
             )
             continue
 
         method = reminder["method"].lower()
         if method not in ["popup", "email"]:
             logger.warning(
-                f"[{function_name}] Invalid reminder method '{method}', must be 'popup' or 'email', skipping"
+                "[%s] Invalid reminder method '%s', must be 'popup' or 'email', skipping",
+                function_name,
+                method,
             )
             continue
 
         minutes = reminder["minutes"]
         if not isinstance(minutes, int) or minutes < 0 or minutes > 40320:
             logger.warning(
-                f"[{function_name}] Invalid reminder minutes '{minutes}', must be integer 0-40320, skipping"
+                "[%s] Invalid reminder minutes '%s', must be integer 0-40320, skipping",
+                function_name,
+                minutes,
             )
             continue
 
@@ -140,10 +148,12 @@ def _apply_transparency_if_valid(
     valid_transparency_values = ["opaque", "transparent"]
     if transparency in valid_transparency_values:
         event_body["transparency"] = transparency
-        logger.info(f"[{function_name}] Set transparency to '{transparency}'")
+        logger.info("[%s] Set transparency to '%s'", function_name, transparency)
     else:
         logger.warning(
-            f"[{function_name}] Invalid transparency value '{transparency}', must be 'opaque' or 'transparent', skipping"
+            "[%s] Invalid transparency value '%s', must be 'opaque' or 'transparent', skipping",
+            function_name,
+            transparency,
         )
 
 
@@ -166,10 +176,12 @@ def _apply_visibility_if_valid(
     valid_visibility_values = ["default", "public", "private", "confidential"]
     if visibility in valid_visibility_values:
         event_body["visibility"] = visibility
-        logger.info(f"[{function_name}] Set visibility to '{visibility}'")
+        logger.info("[%s] Set visibility to '%s'", function_name, visibility)
     else:
         logger.warning(
-            f"[{function_name}] Invalid visibility value '{visibility}', must be 'default', 'public', 'private', or 'confidential', skipping"
+            "[%s] Invalid visibility value '%s', must be 'default', 'public', 'private', or 'confidential', skipping",
+            function_name,
+            visibility,
         )
 
 
@@ -189,7 +201,7 @@ def _preserve_existing_fields(
     for field_name, new_value in field_mappings.items():
         if new_value is None and field_name in existing_event:
             event_body[field_name] = existing_event[field_name]
-            logger.info(f"[modify_event] Preserving existing {field_name}")
+            logger.info("[modify_event] Preserving existing %s", field_name)
         elif new_value is not None:
             event_body[field_name] = new_value
 
@@ -276,7 +288,9 @@ def _correct_time_format_for_api(
         return None
 
     logger.info(
-        f"_correct_time_format_for_api: Processing {param_name} with value '{time_str}'"
+        "_correct_time_format_for_api: Processing %s with value '%s'",
+        param_name,
+        time_str,
     )
 
     # Handle date-only format (YYYY-MM-DD)
@@ -287,12 +301,17 @@ def _correct_time_format_for_api(
             # For date-only, append T00:00:00Z to make it RFC3339 compliant
             formatted = f"{time_str}T00:00:00Z"
             logger.info(
-                f"Formatting date-only {param_name} '{time_str}' to RFC3339: '{formatted}'"
+                "Formatting date-only %s '%s' to RFC3339: '%s'",
+                param_name,
+                time_str,
+                formatted,
             )
             return formatted
         except ValueError:
             logger.warning(
-                f"{param_name} '{time_str}' looks like a date but is not valid YYYY-MM-DD. Using as is."
+                "%s '%s' looks like a date but is not valid YYYY-MM-DD. Using as is.",
+                param_name,
+                time_str,
             )
             return time_str
 
@@ -309,17 +328,19 @@ def _correct_time_format_for_api(
             # Validate the format before appending 'Z'
             datetime.datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S")
             logger.info(
-                f"Formatting {param_name} '{time_str}' by appending 'Z' for UTC."
+                "Formatting %s '%s' by appending 'Z' for UTC.", param_name, time_str
             )
             return time_str + "Z"
         except ValueError:
             logger.warning(
-                f"{param_name} '{time_str}' looks like it needs 'Z' but is not valid YYYY-MM-DDTHH:MM:SS. Using as is."
+                "%s '%s' looks like it needs 'Z' but is not valid YYYY-MM-DDTHH:MM:SS. Using as is.",
+                param_name,
+                time_str,
             )
             return time_str
 
     # If it already has timezone info or doesn't match our patterns, return as is
-    logger.info(f"{param_name} '{time_str}' doesn't need formatting, using as is.")
+    logger.info("%s '%s' doesn't need formatting, using as is.", param_name, time_str)
     return time_str
 
 
@@ -368,7 +389,7 @@ async def list_calendars(service) -> ToolResult:
         calendars=calendar_infos,
     )
 
-    logger.info(f"Successfully listed {len(items)} calendars.")
+    logger.info("Successfully listed %s calendars.", len(items))
     return create_tool_result(text=text_output, data=structured_result)
 
 
@@ -405,12 +426,18 @@ async def get_events(
         Also includes structured_content for machine parsing.
     """
     logger.info(
-        f"[get_events] Raw parameters - event_id: '{event_id}', time_min: '{time_min}', time_max: '{time_max}', query: '{query}', detailed: {detailed}, include_attachments: {include_attachments}"
+        "[get_events] Raw parameters - event_id: '%s', time_min: '%s', time_max: '%s', query: '%s', detailed: %s, include_attachments: %s",
+        event_id,
+        time_min,
+        time_max,
+        query,
+        detailed,
+        include_attachments,
     )
 
     # Handle single event retrieval
     if event_id:
-        logger.info(f"[get_events] Retrieving single event with ID: {event_id}")
+        logger.info("[get_events] Retrieving single event with ID: %s", event_id)
         event = await asyncio.to_thread(
             lambda: service.events()
             .get(calendarId=calendar_id, eventId=event_id)
@@ -428,21 +455,32 @@ async def get_events(
             effective_time_min = utc_now.isoformat().replace("+00:00", "Z")
         if time_min is None:
             logger.info(
-                f"time_min not provided, defaulting to current UTC time: {effective_time_min}"
+                "time_min not provided, defaulting to current UTC time: %s",
+                effective_time_min,
             )
         else:
             logger.info(
-                f"time_min processing: original='{time_min}', formatted='{formatted_time_min}', effective='{effective_time_min}'"
+                "time_min processing: original='%s', formatted='%s', effective='%s'",
+                time_min,
+                formatted_time_min,
+                effective_time_min,
             )
 
         effective_time_max = _correct_time_format_for_api(time_max, "time_max")
         if time_max:
             logger.info(
-                f"time_max processing: original='{time_max}', formatted='{effective_time_max}'"
+                "time_max processing: original='%s', formatted='%s'",
+                time_max,
+                effective_time_max,
             )
 
         logger.info(
-            f"[get_events] Final API parameters - calendarId: '{calendar_id}', timeMin: '{effective_time_min}', timeMax: '{effective_time_max}', maxResults: {max_results}, query: '{query}'"
+            "[get_events] Final API parameters - calendarId: '%s', timeMin: '%s', timeMax: '%s', maxResults: %s, query: '%s'",
+            calendar_id,
+            effective_time_min,
+            effective_time_max,
+            max_results,
+            query,
         )
 
         # Build the request parameters dynamically
@@ -515,7 +553,7 @@ async def get_events(
             event_details += f"- Attachments: {attachment_details_str}\n"
 
         event_details += f"- Event ID: {event_id}\n- Link: {link}"
-        logger.info(f"[get_events] Successfully retrieved detailed event {event_id}.")
+        logger.info("[get_events] Successfully retrieved detailed event %s.", event_id)
 
         # Build structured output for single detailed event
         structured_attendees = [
@@ -669,7 +707,7 @@ async def get_events(
         events=structured_events,
     )
 
-    logger.info(f"Successfully retrieved {len(items)} events.")
+    logger.info("Successfully retrieved %s events.", len(items))
     return create_tool_result(text=text_output, data=structured_result)
 
 
@@ -722,13 +760,13 @@ async def create_event(
         ToolResult: Confirmation message of the successful event creation with event link.
         Also includes structured_content for machine parsing.
     """
-    logger.info(f"[create_event] Invoked. Summary: {summary}")
-    logger.info(f"[create_event] Incoming attachments param: {attachments}")
+    logger.info("[create_event] Invoked. Summary: %s", summary)
+    logger.info("[create_event] Incoming attachments param: %s", attachments)
     # If attachments value is a string, split by comma and strip whitespace
     if attachments and isinstance(attachments, str):
         attachments = [a.strip() for a in attachments.split(",") if a.strip()]
         logger.info(
-            f"[create_event] Parsed attachments list from string: {attachments}"
+            "[create_event] Parsed attachments list from string: %s", attachments
         )
     event_body: Dict[str, Any] = {
         "summary": summary,
@@ -760,7 +798,7 @@ async def create_event(
             if validated_reminders:
                 reminder_data["overrides"] = validated_reminders
                 logger.info(
-                    f"[create_event] Added {len(validated_reminders)} custom reminders"
+                    "[create_event] Added %s custom reminders", len(validated_reminders)
                 )
                 if use_default_reminders:
                     logger.info(
@@ -778,16 +816,17 @@ async def create_event(
     # Handle guest permissions
     if guests_can_modify is not None:
         event_body["guestsCanModify"] = guests_can_modify
-        logger.info(f"[create_event] Set guestsCanModify to {guests_can_modify}")
+        logger.info("[create_event] Set guestsCanModify to %s", guests_can_modify)
     if guests_can_invite_others is not None:
         event_body["guestsCanInviteOthers"] = guests_can_invite_others
         logger.info(
-            f"[create_event] Set guestsCanInviteOthers to {guests_can_invite_others}"
+            "[create_event] Set guestsCanInviteOthers to %s", guests_can_invite_others
         )
     if guests_can_see_other_guests is not None:
         event_body["guestsCanSeeOtherGuests"] = guests_can_see_other_guests
         logger.info(
-            f"[create_event] Set guestsCanSeeOtherGuests to {guests_can_see_other_guests}"
+            "[create_event] Set guestsCanSeeOtherGuests to %s",
+            guests_can_see_other_guests,
         )
 
     if add_google_meet:
@@ -799,7 +838,8 @@ async def create_event(
             }
         }
         logger.info(
-            f"[create_event] Adding Google Meet conference with request ID: {request_id}"
+            "[create_event] Adding Google Meet conference with request ID: %s",
+            request_id,
         )
 
     if attachments:
@@ -813,7 +853,7 @@ async def create_event(
                 )
             except Exception as e:
                 logger.warning(
-                    f"Could not build Drive service for MIME type lookup: {e}"
+                    "Could not build Drive service for MIME type lookup: %s", e
                 )
             for att in attachments:
                 file_id = None
@@ -822,12 +862,15 @@ async def create_event(
                     match = re.search(r"(?:/d/|/file/d/|id=)([\w-]+)", att)
                     file_id = match.group(1) if match else None
                     logger.info(
-                        f"[create_event] Extracted file_id '{file_id}' from attachment URL '{att}'"
+                        "[create_event] Extracted file_id '%s' from attachment URL '%s'",
+                        file_id,
+                        att,
                     )
                 else:
                     file_id = att
                     logger.info(
-                        f"[create_event] Using direct file_id '{file_id}' for attachment"
+                        "[create_event] Using direct file_id '%s' for attachment",
+                        file_id,
                     )
                 if file_id:
                     file_url = f"https://drive.google.com/open?id={file_id}"
@@ -850,7 +893,8 @@ async def create_event(
                             if filename:
                                 title = filename
                                 logger.info(
-                                    f"[create_event] Using filename '{filename}' as attachment title"
+                                    "[create_event] Using filename '%s' as attachment title",
+                                    filename,
                                 )
                             else:
                                 logger.info(
@@ -858,7 +902,7 @@ async def create_event(
                                 )
                         except Exception as e:
                             logger.warning(
-                                f"Could not fetch metadata for file {file_id}: {e}"
+                                "Could not fetch metadata for file %s: %s", file_id, e
                             )
                     event_body["attachments"].append(
                         {
@@ -906,7 +950,7 @@ async def create_event(
                         break
 
     logger.info(
-        f"Event created successfully. ID: {created_event.get('id')}, Link: {link}"
+        "Event created successfully. ID: %s, Link: %s", created_event.get("id"), link
     )
 
     # Build structured output
@@ -944,7 +988,7 @@ def _normalize_attendees(
             normalized.append(att)
         else:
             logger.warning(
-                f"[_normalize_attendees] Invalid attendee format: {att}, skipping"
+                "[_normalize_attendees] Invalid attendee format: %s, skipping", att
             )
     return normalized if normalized else None
 
@@ -1000,7 +1044,7 @@ async def modify_event(
         ToolResult: Confirmation message of the successful event modification with event link.
         Also includes structured_content for machine parsing.
     """
-    logger.info(f"[modify_event] Invoked. Event ID: {event_id}")
+    logger.info("[modify_event] Invoked. Event ID: %s", event_id)
 
     # Build the event body with only the fields that are provided
     event_body: Dict[str, Any] = {}
@@ -1049,7 +1093,7 @@ async def modify_event(
                 )
             except Exception as e:
                 logger.warning(
-                    f"[modify_event] Could not fetch existing event for reminders: {e}"
+                    "[modify_event] Could not fetch existing event for reminders: %s", e
                 )
                 reminder_data["useDefault"] = (
                     True  # Fallback to True if unable to fetch
@@ -1071,7 +1115,8 @@ async def modify_event(
             elif validated_reminders:
                 reminder_data["overrides"] = validated_reminders
                 logger.info(
-                    f"[modify_event] Updated reminders with {len(validated_reminders)} custom reminders"
+                    "[modify_event] Updated reminders with %s custom reminders",
+                    len(validated_reminders),
                 )
 
         event_body["reminders"] = reminder_data
@@ -1085,16 +1130,17 @@ async def modify_event(
     # Handle guest permissions
     if guests_can_modify is not None:
         event_body["guestsCanModify"] = guests_can_modify
-        logger.info(f"[modify_event] Set guestsCanModify to {guests_can_modify}")
+        logger.info("[modify_event] Set guestsCanModify to %s", guests_can_modify)
     if guests_can_invite_others is not None:
         event_body["guestsCanInviteOthers"] = guests_can_invite_others
         logger.info(
-            f"[modify_event] Set guestsCanInviteOthers to {guests_can_invite_others}"
+            "[modify_event] Set guestsCanInviteOthers to %s", guests_can_invite_others
         )
     if guests_can_see_other_guests is not None:
         event_body["guestsCanSeeOtherGuests"] = guests_can_see_other_guests
         logger.info(
-            f"[modify_event] Set guestsCanSeeOtherGuests to {guests_can_see_other_guests}"
+            "[modify_event] Set guestsCanSeeOtherGuests to %s",
+            guests_can_see_other_guests,
         )
 
     if timezone is not None and "start" not in event_body and "end" not in event_body:
@@ -1108,12 +1154,14 @@ async def modify_event(
 
     if not event_body:
         message = "No fields provided to modify the event."
-        logger.warning(f"[modify_event] {message}")
+        logger.warning("[modify_event] %s", message)
         raise Exception(message)
 
     # Log the event ID for debugging
     logger.info(
-        f"[modify_event] Attempting to update event with ID: '{event_id}' in calendar '{calendar_id}'"
+        "[modify_event] Attempting to update event with ID: '%s' in calendar '%s'",
+        event_id,
+        calendar_id,
     )
 
     # Get the existing event to preserve fields that aren't being updated
@@ -1153,7 +1201,8 @@ async def modify_event(
                     }
                 }
                 logger.info(
-                    f"[modify_event] Adding Google Meet conference with request ID: {request_id}"
+                    "[modify_event] Adding Google Meet conference with request ID: %s",
+                    request_id,
                 )
             else:
                 # Remove Google Meet by setting conferenceData to empty
@@ -1167,13 +1216,15 @@ async def modify_event(
     except HttpError as get_error:
         if get_error.resp.status == 404:
             logger.error(
-                f"[modify_event] Event not found during pre-update verification: {get_error}"
+                "[modify_event] Event not found during pre-update verification: %s",
+                get_error,
             )
             message = f"Event not found during verification. The event with ID '{event_id}' could not be found in calendar '{calendar_id}'. This may be due to incorrect ID format or the event no longer exists."
             raise Exception(message)
         else:
             logger.warning(
-                f"[modify_event] Error during pre-update verification, but proceeding with update: {get_error}"
+                "[modify_event] Error during pre-update verification, but proceeding with update: %s",
+                get_error,
             )
 
     # Proceed with the update
@@ -1208,7 +1259,7 @@ async def modify_event(
         google_meet_removed = True
 
     logger.info(
-        f"Event modified successfully. ID: {updated_event.get('id')}, Link: {link}"
+        "Event modified successfully. ID: %s, Link: %s", updated_event.get("id"), link
     )
 
     # Build structured output
@@ -1240,11 +1291,13 @@ async def delete_event(
         ToolResult: Confirmation message of the successful event deletion.
         Also includes structured_content for machine parsing.
     """
-    logger.info(f"[delete_event] Invoked. Event ID: {event_id}")
+    logger.info("[delete_event] Invoked. Event ID: %s", event_id)
 
     # Log the event ID for debugging
     logger.info(
-        f"[delete_event] Attempting to delete event with ID: '{event_id}' in calendar '{calendar_id}'"
+        "[delete_event] Attempting to delete event with ID: '%s' in calendar '%s'",
+        event_id,
+        calendar_id,
     )
 
     # Try to get the event first to verify it exists
@@ -1258,13 +1311,15 @@ async def delete_event(
     except HttpError as get_error:
         if get_error.resp.status == 404:
             logger.error(
-                f"[delete_event] Event not found during pre-delete verification: {get_error}"
+                "[delete_event] Event not found during pre-delete verification: %s",
+                get_error,
             )
             message = f"Event not found during verification. The event with ID '{event_id}' could not be found in calendar '{calendar_id}'. This may be due to incorrect ID format or the event no longer exists."
             raise Exception(message)
         else:
             logger.warning(
-                f"[delete_event] Error during pre-delete verification, but proceeding with deletion: {get_error}"
+                "[delete_event] Error during pre-delete verification, but proceeding with deletion: %s",
+                get_error,
             )
 
     # Proceed with the deletion
@@ -1277,7 +1332,7 @@ async def delete_event(
     confirmation_message = (
         f"Successfully deleted event (ID: {event_id}) from calendar '{calendar_id}'."
     )
-    logger.info(f"Event deleted successfully. ID: {event_id}")
+    logger.info("Event deleted successfully. ID: %s", event_id)
 
     # Build structured output
     structured_result = DeleteEventResult(
@@ -1316,7 +1371,10 @@ async def query_freebusy(
         Also includes structured_content for machine parsing.
     """
     logger.info(
-        f"[query_freebusy] Invoked. Email: '{user_google_email}', time_min: '{time_min}', time_max: '{time_max}'"
+        "[query_freebusy] Invoked. Email: '%s', time_min: '%s', time_max: '%s'",
+        user_google_email,
+        time_min,
+        time_max,
     )
 
     # Format time parameters
@@ -1340,7 +1398,10 @@ async def query_freebusy(
         request_body["calendarExpansionMax"] = calendar_expansion_max
 
     logger.info(
-        f"[query_freebusy] Request body: timeMin={formatted_time_min}, timeMax={formatted_time_max}, calendars={calendar_ids}"
+        "[query_freebusy] Request body: timeMin=%s, timeMax=%s, calendars=%s",
+        formatted_time_min,
+        formatted_time_max,
+        calendar_ids,
     )
 
     # Execute the freebusy query
@@ -1428,7 +1489,8 @@ async def query_freebusy(
 
     result_text = "\n".join(output_lines)
     logger.info(
-        f"[query_freebusy] Successfully retrieved free/busy information for {len(calendars)} calendar(s)"
+        "[query_freebusy] Successfully retrieved free/busy information for %s calendar(s)",
+        len(calendars),
     )
 
     # Build final structured output
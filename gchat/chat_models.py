@@ -5,12 +5,14 @@ Dataclass models representing the structured data returned by Google Chat tools.
 These models provide machine-parseable JSON alongside the human-readable text output.
 """
 
+import sys
 from dataclasses import dataclass
+from typing import Optional
 
-from core.structured_output import generate_schema
+from core.structured_output import fast_dict, generate_schema
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatSpace:
     """Metadata for a Google Chat space."""
 
@@ -18,17 +20,24 @@ class ChatSpace:
     display_name: str
     space_type: str
 
+    # SPACE, GROUP_CHAT or DIRECT_MESSAGE: keep one shared string per value
+    def __post_init__(self) -> None:
+        if isinstance(self.space_type, str):
+            self.space_type = sys.intern(self.space_type)
 
-@dataclass
+
+@dataclass(slots=True)
 class ChatListSpacesResult:
     """Structured result from list_spaces."""
 
     space_type_filter: str
     total_found: int
     spaces: list[ChatSpace]
+    next_page_token: Optional[str] = None
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ChatMessage:
     """Metadata for a Google Chat message."""
 
@@ -38,7 +47,8 @@ class ChatMessage:
     text: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ChatGetMessagesResult:
     """Structured result from get_messages."""
 
@@ -46,9 +56,10 @@ class ChatGetMessagesResult:
     space_name: str
     total_messages: int
     messages: list[ChatMessage]
+    next_page_token: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatSendMessageResult:
     """Structured result from send_message."""
 
@@ -57,7 +68,8 @@ class ChatSendMessageResult:
     create_time: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ChatSearchMessage:
     """Message metadata from search results."""
 
@@ -67,7 +79,8 @@ class ChatSearchMessage:
     space_name: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class ChatSearchMessagesResult:
     """Structured result from search_messages."""
 
@@ -75,6 +88,7 @@ class ChatSearchMessagesResult:
     context: str
     total_found: int
     messages: list[ChatSearchMessage]
+    next_page_token: Optional[str] = None
 
 
 # Pre-generated JSON schemas for use in @server.tool() decorators
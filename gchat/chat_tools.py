@@ -6,15 +6,18 @@ This module provides MCP tools for interacting with Google Chat API.
 
 import logging
 import asyncio
-from typing import Optional
+import time
+import weakref
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional
 
 from googleapiclient.errors import HttpError
 from fastmcp.tools.tool import ToolResult
 
 # Auth & server utilities
-from auth.service_decorator import require_google_service
+from auth.service_decorator import create_batch, require_google_service
 from core.server import server
-from core.utils import handle_http_errors
+from core.utils import handle_http_errors, run_blocking
 from core.structured_output import create_tool_result
 from gchat.chat_models import (
     ChatSpace,
@@ -32,6 +35,53 @@ from gchat.chat_models import (
 
 logger = logging.getLogger(__name__)
 
+# Shared fallback for messages without a sender, instead of a new {} per message
+_NO_SENDER = MappingProxyType({})
+
+# spaces.list filter for each list_spaces space_type; "all" is unfiltered
+_SPACE_TYPE_FILTERS = {
+    "room": "spaceType = SPACE",
+    "dm": "spaceType = DIRECT_MESSAGE",
+}
+
+# Spaces searched when search_messages has no space_id, and how many are
+# searched at once if the batch request fails
+_SEARCH_SPACE_LIMIT = 10
+_SEARCH_SPACE_CONCURRENCY = 5
+
+# Recently listed spaces per service client (one per user and scope set),
+# keyed by the spaces.list parameters.  Space membership changes rarely, so
+# entries expire after a short TTL or when sending to a space fails.
+_SPACES_CACHE: "weakref.WeakKeyDictionary[Any, Dict[tuple, tuple[float, dict]]]" = (
+    weakref.WeakKeyDictionary()
+)
+_SPACES_CACHE_TTL = 60
+
+
+def clear_spaces_cache() -> None:
+    """Drop every cached spaces listing."""
+    _SPACES_CACHE.clear()
+
+
+async def _list_spaces_cached(
+    service: Any, request_params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Return a ``spaces.list`` response, reusing one fetched within the TTL.
+
+    The returned response is shared with the cache; callers must not mutate it.
+    """
+    cache_key = tuple(sorted(request_params.items()))
+    listings = _SPACES_CACHE.get(service)
+    if listings is None:
+        listings = _SPACES_CACHE[service] = {}
+    cached = listings.get(cache_key)
+    if cached is not None and time.monotonic() - cached[0] < _SPACES_CACHE_TTL:
+        return cached[1]
+
+    response = await run_blocking(service.spaces().list(**request_params).execute)
+    listings[cache_key] = (time.monotonic(), response)
+    return response
+
 
 @server.tool(output_schema=CHAT_LIST_SPACES_RESULT_SCHEMA)
 @require_google_service("chat", "chat_read")
@@ -40,6 +90,7 @@ async def list_spaces(
     service,
     page_size: int = 100,
     space_type: str = "all",  # "all", "room", "dm"
+    page_token: Optional[str] = None,
 ) -> ToolResult:
     """
     Lists Google Chat spaces (rooms and direct messages) accessible to the user.
@@ -48,27 +99,24 @@ async def list_spaces(
         ToolResult: A formatted list of Google Chat spaces accessible to the user.
         Also includes structured_content for machine parsing.
     """
-    logger.info(f"[list_spaces] Type={space_type}")
-
-    # Build filter based on space_type
-    filter_param = None
-    if space_type == "room":
-        filter_param = "spaceType = SPACE"
-    elif space_type == "dm":
-        filter_param = "spaceType = DIRECT_MESSAGE"
+    logger.info("[list_spaces] Type=%s", space_type)
 
+    filter_param = _SPACE_TYPE_FILTERS.get(space_type)
     request_params = {"pageSize": page_size}
     if filter_param:
         request_params["filter"] = filter_param
+    if page_token:
+        request_params["pageToken"] = page_token
 
-    response = await asyncio.to_thread(service.spaces().list(**request_params).execute)
-
+    response = await _list_spaces_cached(service, request_params)
     spaces = response.get("spaces", [])
+    next_page_token = response.get("nextPageToken")
     if not spaces:
         structured_result = ChatListSpacesResult(
             space_type_filter=space_type,
             total_found=0,
             spaces=[],
+            next_page_token=next_page_token,
         )
         return create_tool_result(
             text=f"No Chat spaces found for type '{space_type}'.",
@@ -90,10 +138,14 @@ async def list_spaces(
             )
         )
 
+    if next_page_token:
+        output.append(f"\nNext page token: {next_page_token}")
+
     structured_result = ChatListSpacesResult(
         space_type_filter=space_type,
         total_found=len(spaces),
         spaces=space_list,
+        next_page_token=next_page_token,
     )
 
     return create_tool_result(text="\n".join(output), data=structured_result)
@@ -107,6 +159,7 @@ async def get_messages(
     space_id: str,
     page_size: int = 50,
     order_by: str = "createTime desc",
+    page_token: Optional[str] = None,
 ) -> ToolResult:
     """
     Retrieves messages from a Google Chat space.
@@ -115,59 +168,60 @@ async def get_messages(
         ToolResult: Formatted messages from the specified space.
         Also includes structured_content for machine parsing.
     """
-    logger.info(f"[get_messages] Space ID: '{space_id}'")
+    logger.info("[get_messages] Space ID: '%s'", space_id)
 
-    # Get space info first
-    space_info = await asyncio.to_thread(service.spaces().get(name=space_id).execute)
-    space_name = space_info.get("displayName", "Unknown Space")
+    request_params = {"parent": space_id, "pageSize": page_size, "orderBy": order_by}
+    if page_token:
+        request_params["pageToken"] = page_token
 
-    # Get messages
-    response = await asyncio.to_thread(
-        service.spaces()
-        .messages()
-        .list(parent=space_id, pageSize=page_size, orderBy=order_by)
-        .execute
+    # Space info and messages are independent, so fetch them together
+    space_info, response = await asyncio.gather(
+        run_blocking(service.spaces().get(name=space_id).execute),
+        run_blocking(service.spaces().messages().list(**request_params).execute),
     )
+    space_name = space_info.get("displayName", "Unknown Space")
 
     messages = response.get("messages", [])
+    next_page_token = response.get("nextPageToken")
     if not messages:
         structured_result = ChatGetMessagesResult(
             space_id=space_id,
             space_name=space_name,
             total_messages=0,
             messages=[],
+            next_page_token=next_page_token,
         )
         return create_tool_result(
             text=f"No messages found in space '{space_name}' (ID: {space_id}).",
             data=structured_result,
         )
 
-    output = [f"Messages from '{space_name}' (ID: {space_id}):\n"]
-    message_list = []
-    for msg in messages:
-        sender = msg.get("sender", {}).get("displayName", "Unknown Sender")
-        create_time = msg.get("createTime", "Unknown Time")
-        text_content = msg.get("text", "No text content")
-        msg_name = msg.get("name", "")
-
-        output.append(f"[{create_time}] {sender}:")
-        output.append(f"  {text_content}")
-        output.append(f"  (Message ID: {msg_name})\n")
-
-        message_list.append(
-            ChatMessage(
-                message_id=msg_name,
-                sender=sender,
-                create_time=create_time,
-                text=text_content,
-            )
+    message_list = [
+        ChatMessage(
+            message_id=msg.get("name", ""),
+            sender=msg.get("sender", _NO_SENDER).get("displayName", "Unknown Sender"),
+            create_time=msg.get("createTime", "Unknown Time"),
+            text=msg.get("text", "No text content"),
         )
+        for msg in messages
+    ]
+    output = [
+        f"Messages from '{space_name}' (ID: {space_id}):\n",
+        *(
+            f"[{m.create_time}] {m.sender}:\n  {m.text}\n  (Message ID: {m.message_id})\n"
+            for m in message_list
+        ),
+    ]
+
+    if next_page_token:
+        output.append(f"Next page token: {next_page_token}")
 
     structured_result = ChatGetMessagesResult(
         space_id=space_id,
         space_name=space_name,
         total_messages=len(messages),
         messages=message_list,
+        next_page_token=next_page_token,
     )
 
     return create_tool_result(text="\n".join(output), data=structured_result)
@@ -189,7 +243,7 @@ async def send_message(
         ToolResult: Confirmation message with sent message details.
         Also includes structured_content for machine parsing.
     """
-    logger.info(f"[send_message] Space: '{space_id}'")
+    logger.info("[send_message] Space: '%s'", space_id)
 
     message_body = {"text": message_text}
 
@@ -198,15 +252,21 @@ async def send_message(
     if thread_key:
         request_params["threadKey"] = thread_key
 
-    message = await asyncio.to_thread(
-        service.spaces().messages().create(**request_params).execute
-    )
+    try:
+        message = await run_blocking(
+            service.spaces().messages().create(**request_params).execute
+        )
+    except HttpError as e:
+        if 400 <= e.resp.status < 500:
+            # The space may have been left or deleted; relist on next use
+            _SPACES_CACHE.pop(service, None)
+        raise
 
     message_name = message.get("name", "")
     create_time = message.get("createTime", "")
 
     msg = f"Message sent to space '{space_id}'. Message ID: {message_name}, Time: {create_time}"
-    logger.info(f"Successfully sent message to space '{space_id}'")
+    logger.info("Successfully sent message to space '%s'", space_id)
 
     structured_result = ChatSendMessageResult(
         space_id=space_id,
@@ -217,6 +277,91 @@ async def send_message(
     return create_tool_result(text=msg, data=structured_result)
 
 
+def _space_search_request(service: Any, space: Dict[str, Any], query: str) -> Any:
+    """Build the messages.list request that searches one space for ``query``."""
+    return (
+        service.spaces()
+        .messages()
+        .list(parent=space.get("name"), pageSize=5, filter=f'text:"{query}"')
+    )
+
+
+async def _search_space_messages(
+    service: Any,
+    space: Dict[str, Any],
+    query: str,
+    semaphore: asyncio.Semaphore,
+) -> Dict[str, Any]:
+    """Search one space, with at most ``semaphore`` searches in flight."""
+    async with semaphore:
+        return await run_blocking(_space_search_request(service, space, query).execute)
+
+
+def _is_transient(response: Any) -> bool:
+    """Return True for a missing batch part or a retryable (429/5xx) error."""
+    if response is None:
+        return True
+    return isinstance(response, HttpError) and (
+        response.resp.status == 429 or response.resp.status >= 500
+    )
+
+
+async def _search_spaces(
+    service: Any, spaces: List[Dict[str, Any]], query: str
+) -> List[Any]:
+    """Search several spaces, returning a response or exception per space.
+
+    All searches are sent in one batch request.  If the batch itself fails,
+    every space is searched again individually and concurrently; otherwise
+    only spaces whose part was missing or failed with 429/5xx are.  Other
+    errors, such as 403/404 for spaces the user cannot read, are returned
+    as-is.
+    """
+    results: Dict[str, Any] = {}
+
+    def _batch_callback(request_id, response, exception):
+        results[request_id] = response if exception is None else exception
+
+    try:
+        batch = create_batch(service, callback=_batch_callback)
+        for index, space in enumerate(spaces):
+            batch.add(
+                _space_search_request(service, space, query), request_id=str(index)
+            )
+        await run_blocking(batch.execute)
+        responses = [results.get(str(index)) for index in range(len(spaces))]
+        retry = [
+            index for index, response in enumerate(responses) if _is_transient(response)
+        ]
+        if retry:
+            logger.warning(
+                "[search_messages] Batch search failed for %d space(s), retrying "
+                "individually: %s",
+                len(retry),
+                ", ".join(str(spaces[index].get("name")) for index in retry),
+            )
+    except HttpError as batch_error:
+        logger.warning(
+            "[search_messages] Batch request failed, searching spaces individually: %s",
+            batch_error,
+        )
+        responses = [None] * len(spaces)
+        retry = list(range(len(spaces)))
+
+    if retry:
+        semaphore = asyncio.Semaphore(_SEARCH_SPACE_CONCURRENCY)
+        retried = await asyncio.gather(
+            *(
+                _search_space_messages(service, spaces[index], query, semaphore)
+                for index in retry
+            ),
+            return_exceptions=True,
+        )
+        for index, response in zip(retry, retried):
+            responses[index] = response
+    return responses
+
+
 @server.tool(output_schema=CHAT_SEARCH_MESSAGES_RESULT_SCHEMA)
 @require_google_service("chat", "chat_read")
 @handle_http_errors("search_messages", service_type="chat")
@@ -225,51 +370,59 @@ async def search_messages(
     query: str,
     space_id: Optional[str] = None,
     page_size: int = 25,
+    page_token: Optional[str] = None,
 ) -> ToolResult:
     """
     Searches for messages in Google Chat spaces by text content.
 
+    page_token continues a search within space_id; searches across all
+    spaces return a single page.
+
     Returns:
         ToolResult: A formatted list of messages matching the search query.
         Also includes structured_content for machine parsing.
     """
-    logger.info(f"[search_messages] Query='{query}'")
+    logger.info("[search_messages] Query='%s'", query)
 
     # If specific space provided, search within that space
+    next_page_token = None
     if space_id:
-        response = await asyncio.to_thread(
-            service.spaces()
-            .messages()
-            .list(parent=space_id, pageSize=page_size, filter=f'text:"{query}"')
-            .execute
+        request_params = {
+            "parent": space_id,
+            "pageSize": page_size,
+            "filter": f'text:"{query}"',
+        }
+        if page_token:
+            request_params["pageToken"] = page_token
+        response = await run_blocking(
+            service.spaces().messages().list(**request_params).execute
         )
         messages = response.get("messages", [])
+        next_page_token = response.get("nextPageToken")
         context = f"space '{space_id}'"
     else:
         # Search across all accessible spaces (this may require iterating through spaces)
         # For simplicity, we'll search the user's spaces first
-        spaces_response = await asyncio.to_thread(
-            service.spaces().list(pageSize=100).execute
-        )
+        spaces_response = await _list_spaces_cached(service, {"pageSize": 100})
         spaces = spaces_response.get("spaces", [])
 
+        spaces = spaces[:_SEARCH_SPACE_LIMIT]
+        results = await _search_spaces(service, spaces, query) if spaces else []
+
         messages = []
-        for space in spaces[:10]:  # Limit to first 10 spaces to avoid timeout
-            try:
-                space_messages = await asyncio.to_thread(
-                    service.spaces()
-                    .messages()
-                    .list(
-                        parent=space.get("name"), pageSize=5, filter=f'text:"{query}"'
-                    )
-                    .execute
+        for space, result in zip(spaces, results):
+            if isinstance(result, HttpError):
+                # Skip spaces we can't access
+                logger.warning(
+                    "[search_messages] Skipping space %s: %s", space.get("name"), result
                 )
-                space_msgs = space_messages.get("messages", [])
-                for msg in space_msgs:
-                    msg["_space_name"] = space.get("displayName", "Unknown")
-                messages.extend(space_msgs)
-            except HttpError:
-                continue  # Skip spaces we can't access
+                continue
+            if isinstance(result, BaseException):
+                raise result
+            space_msgs = result.get("messages", [])
+            for msg in space_msgs:
+                msg["_space_name"] = space.get("displayName", "Unknown")
+            messages.extend(space_msgs)
         context = "all accessible spaces"
 
     if not messages:
@@ -278,41 +431,43 @@ async def search_messages(
             context=context,
             total_found=0,
             messages=[],
+            next_page_token=next_page_token,
         )
         return create_tool_result(
             text=f"No messages found matching '{query}' in {context}.",
             data=structured_result,
         )
 
-    output = [f"Found {len(messages)} messages matching '{query}' in {context}:"]
-    message_list = []
-    for msg in messages:
-        sender = msg.get("sender", {}).get("displayName", "Unknown Sender")
-        create_time = msg.get("createTime", "Unknown Time")
-        text_content = msg.get("text", "No text content")
-        space_name = msg.get("_space_name", "Unknown Space")
-
-        # Truncate long messages for text output
-        display_text = text_content
-        if len(display_text) > 100:
-            display_text = display_text[:100] + "..."
-
-        output.append(f"- [{create_time}] {sender} in '{space_name}': {display_text}")
-
-        message_list.append(
-            ChatSearchMessage(
-                sender=sender,
-                create_time=create_time,
-                text=text_content,  # Full text in structured output
-                space_name=space_name,
-            )
+    # Full text in structured output; truncated below for the text output.
+    # Arguments are positional, in ChatSearchMessage field order.
+    message_list = [
+        ChatSearchMessage(
+            msg.get("sender", _NO_SENDER).get("displayName", "Unknown Sender"),
+            msg.get("createTime", "Unknown Time"),
+            msg.get("text", "No text content"),
+            msg.get("_space_name", "Unknown Space"),
         )
+        for msg in messages
+    ]
+    output = [
+        f"Found {len(messages)} messages matching '{query}' in {context}:",
+        *(
+            # A slice that covers the whole string returns it without copying
+            f"- [{m.create_time}] {m.sender} in '{m.space_name}': "
+            f"{m.text[:100]}{'...' if len(m.text) > 100 else ''}"
+            for m in message_list
+        ),
+    ]
+
+    if next_page_token:
+        output.append(f"\nNext page token: {next_page_token}")
 
     structured_result = ChatSearchMessagesResult(
         query=query,
         context=context,
         total_found=len(messages),
         messages=message_list,
+        next_page_token=next_page_token,
     )
 
     return create_tool_result(text="\n".join(output), data=structured_result)
@@ -11,7 +11,7 @@ from typing import Optional
 from core.structured_output import generate_schema
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactOrganization:
     """Organization information for a contact."""
 
@@ -19,7 +19,7 @@ class ContactOrganization:
     title: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactSummary:
     """Summary of a contact from list/search results."""
 
@@ -30,7 +30,7 @@ class ContactSummary:
     organization: Optional[ContactOrganization] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactDetails:
     """Detailed contact information."""
 
@@ -46,7 +46,7 @@ class ContactDetails:
     sources: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class ListContactsResult:
     """Structured result from list_contacts."""
 
@@ -56,14 +56,14 @@ class ListContactsResult:
     next_page_token: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GetContactResult:
     """Structured result from get_contact."""
 
     contact: ContactDetails
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchContactsResult:
     """Structured result from search_contacts."""
 
@@ -72,21 +72,21 @@ class SearchContactsResult:
     contacts: list[ContactSummary]
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateContactResult:
     """Structured result from create_contact."""
 
     contact: ContactDetails
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateContactResult:
     """Structured result from update_contact."""
 
     contact: ContactDetails
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteContactResult:
     """Structured result from delete_contact."""
 
@@ -94,7 +94,7 @@ class DeleteContactResult:
     deleted: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactGroupSummary:
     """Summary of a contact group."""
 
@@ -104,7 +104,7 @@ class ContactGroupSummary:
     member_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ListContactGroupsResult:
     """Structured result from list_contact_groups."""
 
@@ -113,7 +113,7 @@ class ListContactGroupsResult:
     next_page_token: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactGroupDetails:
     """Detailed contact group information."""
 
@@ -124,14 +124,14 @@ class ContactGroupDetails:
     member_ids: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class GetContactGroupResult:
     """Structured result from get_contact_group."""
 
     group: ContactGroupDetails
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchCreateContactsResult:
     """Structured result from batch_create_contacts."""
 
@@ -139,7 +139,7 @@ class BatchCreateContactsResult:
     contacts: list[ContactSummary]
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchUpdateContactsResult:
     """Structured result from batch_update_contacts."""
 
@@ -147,7 +147,7 @@ class BatchUpdateContactsResult:
     contacts: list[ContactSummary]
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchDeleteContactsResult:
     """Structured result from batch_delete_contacts."""
 
@@ -155,14 +155,14 @@ class BatchDeleteContactsResult:
     deleted: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class CreateContactGroupResult:
     """Structured result from create_contact_group."""
 
     group: ContactGroupSummary
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateContactGroupResult:
     """Structured result from update_contact_group."""
 
@@ -170,7 +170,7 @@ class UpdateContactGroupResult:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DeleteContactGroupResult:
     """Structured result from delete_contact_group."""
 
@@ -179,7 +179,7 @@ class DeleteContactGroupResult:
     contacts_deleted: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ModifyContactGroupMembersResult:
     """Structured result from modify_contact_group_members."""
 
@@ -5,13 +5,14 @@ Dataclass models representing the structured data returned by Google Docs tools.
 These models provide machine-parseable JSON alongside the human-readable text output.
 """
 
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
-from core.structured_output import generate_schema
+from core.structured_output import fast_dict, generate_schema
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsSearchResultItem:
     """Summary of a Google Doc from search results."""
 
@@ -21,7 +22,7 @@ class DocsSearchResultItem:
     web_link: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsSearchResult:
     """Structured result from search_docs."""
 
@@ -30,7 +31,7 @@ class DocsSearchResult:
     documents: list[DocsSearchResultItem]
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsContent:
     """Structured result from get_doc_content."""
 
@@ -41,7 +42,7 @@ class DocsContent:
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsListResult:
     """Structured result from list_docs_in_folder."""
 
@@ -50,7 +51,7 @@ class DocsListResult:
     documents: list[DocsSearchResultItem]
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsCreateResult:
     """Structured result from create_doc."""
 
@@ -59,7 +60,7 @@ class DocsCreateResult:
     web_link: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsModifyTextResult:
     """Structured result from modify_doc_text."""
 
@@ -69,7 +70,7 @@ class DocsModifyTextResult:
     web_link: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsFindReplaceResult:
     """Structured result from find_and_replace_doc."""
 
@@ -80,7 +81,7 @@ class DocsFindReplaceResult:
     web_link: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsInsertElementResult:
     """Structured result from insert_doc_elements."""
 
@@ -91,7 +92,7 @@ class DocsInsertElementResult:
     web_link: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsInsertImageResult:
     """Structured result from insert_doc_image."""
 
@@ -102,7 +103,7 @@ class DocsInsertImageResult:
     web_link: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsHeaderFooterResult:
     """Structured result from update_doc_headers_footers."""
 
@@ -113,7 +114,7 @@ class DocsHeaderFooterResult:
     web_link: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsBatchUpdateResult:
     """Structured result from batch_update_doc."""
 
@@ -124,7 +125,8 @@ class DocsBatchUpdateResult:
     web_link: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DocsElementSummary:
     """Summary of a document element."""
 
@@ -136,8 +138,14 @@ class DocsElementSummary:
     cell_count: Optional[int] = None
     text_preview: Optional[str] = None
 
+    # Only a handful of element types exist, so share one string for each
+    def __post_init__(self) -> None:
+        if isinstance(self.element_type, str):
+            self.element_type = sys.intern(self.element_type)
 
-@dataclass
+
+@fast_dict
+@dataclass(slots=True)
 class DocsTablePosition:
     """Table position information."""
 
@@ -145,7 +153,8 @@ class DocsTablePosition:
     end: int
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DocsTableDimensions:
     """Table dimensions."""
 
@@ -153,7 +162,8 @@ class DocsTableDimensions:
     columns: int
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DocsTableSummary:
     """Summary of a table in the document."""
 
@@ -163,7 +173,8 @@ class DocsTableSummary:
     preview: list[list[str]] = field(default_factory=list)
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DocsStructureStatistics:
     """Document structure statistics."""
 
@@ -174,7 +185,8 @@ class DocsStructureStatistics:
     has_footers: bool
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DocsStructureResult:
     """Structured result from inspect_doc_structure."""
 
@@ -189,7 +201,7 @@ class DocsStructureResult:
     web_link: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsCreateTableResult:
     """Structured result from create_table_with_data."""
 
@@ -202,7 +214,7 @@ class DocsCreateTableResult:
     success: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsCellDebugInfo:
     """Debug information for a single table cell."""
 
@@ -213,7 +225,7 @@ class DocsCellDebugInfo:
     content_elements_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsTableDebugResult:
     """Structured result from debug_table_structure."""
 
@@ -225,7 +237,7 @@ class DocsTableDebugResult:
     web_link: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsExportPdfResult:
     """Structured result from export_doc_to_pdf."""
 
@@ -239,7 +251,7 @@ class DocsExportPdfResult:
     original_web_link: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DocsParagraphStyleResult:
     """Structured result from update_paragraph_style."""
 
@@ -250,19 +262,31 @@ class DocsParagraphStyleResult:
     web_link: str
 
 
-# Pre-generated JSON schemas for use in @server.tool() decorators
-DOCS_SEARCH_RESULT_SCHEMA = generate_schema(DocsSearchResult)
-DOCS_CONTENT_SCHEMA = generate_schema(DocsContent)
-DOCS_LIST_RESULT_SCHEMA = generate_schema(DocsListResult)
-DOCS_CREATE_RESULT_SCHEMA = generate_schema(DocsCreateResult)
-DOCS_MODIFY_TEXT_RESULT_SCHEMA = generate_schema(DocsModifyTextResult)
-DOCS_FIND_REPLACE_RESULT_SCHEMA = generate_schema(DocsFindReplaceResult)
-DOCS_INSERT_ELEMENT_RESULT_SCHEMA = generate_schema(DocsInsertElementResult)
-DOCS_INSERT_IMAGE_RESULT_SCHEMA = generate_schema(DocsInsertImageResult)
-DOCS_HEADER_FOOTER_RESULT_SCHEMA = generate_schema(DocsHeaderFooterResult)
-DOCS_BATCH_UPDATE_RESULT_SCHEMA = generate_schema(DocsBatchUpdateResult)
-DOCS_STRUCTURE_RESULT_SCHEMA = generate_schema(DocsStructureResult)
-DOCS_CREATE_TABLE_RESULT_SCHEMA = generate_schema(DocsCreateTableResult)
-DOCS_TABLE_DEBUG_RESULT_SCHEMA = generate_schema(DocsTableDebugResult)
-DOCS_EXPORT_PDF_RESULT_SCHEMA = generate_schema(DocsExportPdfResult)
-DOCS_PARAGRAPH_STYLE_RESULT_SCHEMA = generate_schema(DocsParagraphStyleResult)
+# JSON schemas for use in @server.tool() decorators, built on first access
+_SCHEMA_SPECS = {
+    "DOCS_SEARCH_RESULT_SCHEMA": DocsSearchResult,
+    "DOCS_CONTENT_SCHEMA": DocsContent,
+    "DOCS_LIST_RESULT_SCHEMA": DocsListResult,
+    "DOCS_CREATE_RESULT_SCHEMA": DocsCreateResult,
+    "DOCS_MODIFY_TEXT_RESULT_SCHEMA": DocsModifyTextResult,
+    "DOCS_FIND_REPLACE_RESULT_SCHEMA": DocsFindReplaceResult,
+    "DOCS_INSERT_ELEMENT_RESULT_SCHEMA": DocsInsertElementResult,
+    "DOCS_INSERT_IMAGE_RESULT_SCHEMA": DocsInsertImageResult,
+    "DOCS_HEADER_FOOTER_RESULT_SCHEMA": DocsHeaderFooterResult,
+    "DOCS_BATCH_UPDATE_RESULT_SCHEMA": DocsBatchUpdateResult,
+    "DOCS_STRUCTURE_RESULT_SCHEMA": DocsStructureResult,
+    "DOCS_CREATE_TABLE_RESULT_SCHEMA": DocsCreateTableResult,
+    "DOCS_TABLE_DEBUG_RESULT_SCHEMA": DocsTableDebugResult,
+    "DOCS_EXPORT_PDF_RESULT_SCHEMA": DocsExportPdfResult,
+    "DOCS_PARAGRAPH_STYLE_RESULT_SCHEMA": DocsParagraphStyleResult,
+}
+
+
+def __getattr__(name: str) -> dict[str, Any]:
+    """Resolve a ``*_SCHEMA`` constant and cache it as a module global."""
+    model = _SCHEMA_SPECS.get(name)
+    if model is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    schema = generate_schema(model)
+    globals()[name] = schema
+    return schema
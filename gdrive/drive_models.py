@@ -5,13 +5,15 @@ Dataclass models representing the structured data returned by Google Drive tools
 These models provide machine-parseable JSON alongside the human-readable text output.
 """
 
+import sys
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Optional
 
-from core.structured_output import generate_schema
+from core.structured_output import fast_dict, generate_schema
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DriveFileItem:
     """Summary of a file or folder in Google Drive."""
 
@@ -22,8 +24,15 @@ class DriveFileItem:
     modified_time: Optional[str] = None
     size: Optional[str] = None
 
+    # mime_type values repeat across a listing; interning lets every
+    # item share one string object.
+    def __post_init__(self) -> None:
+        if isinstance(self.mime_type, str):
+            self.mime_type = sys.intern(self.mime_type)
 
-@dataclass
+
+@fast_dict
+@dataclass(slots=True)
 class DriveSearchResult:
     """Structured result from search_drive_files."""
 
@@ -32,7 +41,8 @@ class DriveSearchResult:
     files: list[DriveFileItem]
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DriveListResult:
     """Structured result from list_drive_items."""
 
@@ -41,7 +51,7 @@ class DriveListResult:
     items: list[DriveFileItem]
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveFileContent:
     """Structured result from get_drive_file_content."""
 
@@ -52,7 +62,7 @@ class DriveFileContent:
     content: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveDownloadResult:
     """Structured result from get_drive_file_download_url."""
 
@@ -64,7 +74,7 @@ class DriveDownloadResult:
     stateless_mode: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveCreateResult:
     """Structured result from create_drive_file."""
 
@@ -74,7 +84,7 @@ class DriveCreateResult:
     web_view_link: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveImportResult:
     """Structured result from import_to_google_doc."""
 
@@ -85,7 +95,8 @@ class DriveImportResult:
     web_view_link: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DrivePermission:
     """Represents a Google Drive permission."""
 
@@ -97,7 +108,8 @@ class DrivePermission:
     expiration_time: Optional[str] = None
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DrivePermissionsResult:
     """Structured result from get_drive_file_permissions."""
 
@@ -113,7 +125,7 @@ class DrivePermissionsResult:
     permissions: list[DrivePermission] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class DrivePublicAccessResult:
     """Structured result from check_drive_file_public_access."""
 
@@ -125,7 +137,7 @@ class DrivePublicAccessResult:
     drive_image_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveUpdateResult:
     """Structured result from update_drive_file."""
 
@@ -135,7 +147,8 @@ class DriveUpdateResult:
     changes_applied: list[str] = field(default_factory=list)
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DriveShareableLinkResult:
     """Structured result from get_drive_shareable_link."""
 
@@ -148,7 +161,8 @@ class DriveShareableLinkResult:
     permissions: list[DrivePermission] = field(default_factory=list)
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DriveShareResult:
     """Structured result from share_drive_file."""
 
@@ -158,7 +172,8 @@ class DriveShareResult:
     web_view_link: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DriveBatchShareResultItem:
     """Result for a single recipient in batch share."""
 
@@ -168,7 +183,8 @@ class DriveBatchShareResultItem:
     error: Optional[str] = None
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DriveBatchShareResult:
     """Structured result from batch_share_drive_file."""
 
@@ -180,7 +196,8 @@ class DriveBatchShareResult:
     web_view_link: str
 
 
-@dataclass
+@fast_dict
+@dataclass(slots=True)
 class DrivePermissionUpdateResult:
     """Structured result from update_drive_permission."""
 
@@ -189,7 +206,7 @@ class DrivePermissionUpdateResult:
     permission: DrivePermission
 
 
-@dataclass
+@dataclass(slots=True)
 class DrivePermissionRemoveResult:
     """Structured result from remove_drive_permission."""
 
@@ -198,7 +215,7 @@ class DrivePermissionRemoveResult:
     permission_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveCopyResult:
     """Structured result from copy_drive_file."""
 
@@ -211,7 +228,7 @@ class DriveCopyResult:
     web_view_link: str
 
 
-@dataclass
+@dataclass(slots=True)
 class DriveOwnershipTransferResult:
     """Structured result from transfer_drive_ownership."""
 
@@ -222,20 +239,32 @@ class DriveOwnershipTransferResult:
     moved_to_new_owners_root: bool = False
 
 
-# Pre-generated JSON schemas for use in @server.tool() decorators
-DRIVE_SEARCH_RESULT_SCHEMA = generate_schema(DriveSearchResult)
-DRIVE_LIST_RESULT_SCHEMA = generate_schema(DriveListResult)
-DRIVE_FILE_CONTENT_SCHEMA = generate_schema(DriveFileContent)
-DRIVE_DOWNLOAD_RESULT_SCHEMA = generate_schema(DriveDownloadResult)
-DRIVE_CREATE_RESULT_SCHEMA = generate_schema(DriveCreateResult)
-DRIVE_IMPORT_RESULT_SCHEMA = generate_schema(DriveImportResult)
-DRIVE_PERMISSIONS_RESULT_SCHEMA = generate_schema(DrivePermissionsResult)
-DRIVE_PUBLIC_ACCESS_RESULT_SCHEMA = generate_schema(DrivePublicAccessResult)
-DRIVE_UPDATE_RESULT_SCHEMA = generate_schema(DriveUpdateResult)
-DRIVE_SHAREABLE_LINK_RESULT_SCHEMA = generate_schema(DriveShareableLinkResult)
-DRIVE_SHARE_RESULT_SCHEMA = generate_schema(DriveShareResult)
-DRIVE_BATCH_SHARE_RESULT_SCHEMA = generate_schema(DriveBatchShareResult)
-DRIVE_PERMISSION_UPDATE_RESULT_SCHEMA = generate_schema(DrivePermissionUpdateResult)
-DRIVE_PERMISSION_REMOVE_RESULT_SCHEMA = generate_schema(DrivePermissionRemoveResult)
-DRIVE_COPY_RESULT_SCHEMA = generate_schema(DriveCopyResult)
-DRIVE_OWNERSHIP_TRANSFER_RESULT_SCHEMA = generate_schema(DriveOwnershipTransferResult)
+# JSON schemas for use in @server.tool() decorators, built on first access
+_SCHEMA_SPECS = {
+    "DRIVE_SEARCH_RESULT_SCHEMA": DriveSearchResult,
+    "DRIVE_LIST_RESULT_SCHEMA": DriveListResult,
+    "DRIVE_FILE_CONTENT_SCHEMA": DriveFileContent,
+    "DRIVE_DOWNLOAD_RESULT_SCHEMA": DriveDownloadResult,
+    "DRIVE_CREATE_RESULT_SCHEMA": DriveCreateResult,
+    "DRIVE_IMPORT_RESULT_SCHEMA": DriveImportResult,
+    "DRIVE_PERMISSIONS_RESULT_SCHEMA": DrivePermissionsResult,
+    "DRIVE_PUBLIC_ACCESS_RESULT_SCHEMA": DrivePublicAccessResult,
+    "DRIVE_UPDATE_RESULT_SCHEMA": DriveUpdateResult,
+    "DRIVE_SHAREABLE_LINK_RESULT_SCHEMA": DriveShareableLinkResult,
+    "DRIVE_SHARE_RESULT_SCHEMA": DriveShareResult,
+    "DRIVE_BATCH_SHARE_RESULT_SCHEMA": DriveBatchShareResult,
+    "DRIVE_PERMISSION_UPDATE_RESULT_SCHEMA": DrivePermissionUpdateResult,
+    "DRIVE_PERMISSION_REMOVE_RESULT_SCHEMA": DrivePermissionRemoveResult,
+    "DRIVE_COPY_RESULT_SCHEMA": DriveCopyResult,
+    "DRIVE_OWNERSHIP_TRANSFER_RESULT_SCHEMA": DriveOwnershipTransferResult,
+}
+
+
+def __getattr__(name: str) -> dict[str, Any]:
+    """Resolve a ``*_SCHEMA`` constant and cache it as a module global."""
+    model = _SCHEMA_SPECS.get(name)
+    if model is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    schema = generate_schema(model)
+    globals()[name] = schema
+    return schema
@@ -784,6 +784,18 @@ GOOGLE_DOCS_IMPORT_FORMATS = {
 GOOGLE_DOCS_MIME_TYPE = "application/vnd.google-apps.document"
 
 
+def _drive_permission(perm: Dict[str, Any]) -> DrivePermission:
+    """Build the structured summary of a permission resource."""
+    return DrivePermission(
+        id=perm.get("id", ""),
+        type=perm.get("type", ""),
+        role=perm.get("role", ""),
+        email_address=perm.get("emailAddress"),
+        domain=perm.get("domain"),
+        expiration_time=perm.get("expirationTime"),
+    )
+
+
 def _validate_url_not_internal(url: str) -> None:
     """
     Validate that a URL doesn't point to internal/private networks (SSRF protection).
@@ -1139,17 +1151,7 @@ async def get_drive_file_permissions(
         text_output = "\n".join(output_parts)
 
         # Build structured permissions list
-        permission_items = [
-            DrivePermission(
-                id=perm.get("id", ""),
-                type=perm.get("type", ""),
-                role=perm.get("role", ""),
-                email_address=perm.get("emailAddress"),
-                domain=perm.get("domain"),
-                expiration_time=perm.get("expirationTime"),
-            )
-            for perm in permissions
-        ]
+        permission_items = [_drive_permission(perm) for perm in permissions]
 
         result = DrivePermissionsResult(
             file_id=file_id,
@@ -1528,17 +1530,7 @@ async def get_drive_shareable_link(
     text_output = "\n".join(output_parts)
 
     # Build structured permissions list
-    permission_items = [
-        DrivePermission(
-            id=perm.get("id", ""),
-            type=perm.get("type", ""),
-            role=perm.get("role", ""),
-            email_address=perm.get("emailAddress"),
-            domain=perm.get("domain"),
-            expiration_time=perm.get("expirationTime"),
-        )
-        for perm in permissions
-    ]
+    permission_items = [_drive_permission(perm) for perm in permissions]
 
     result = DriveShareableLinkResult(
         file_id=file_id,
@@ -1646,14 +1638,7 @@ async def share_drive_file(
     ]
 
     text_output = "\n".join(output_parts)
-    permission = DrivePermission(
-        id=created_permission.get("id", ""),
-        type=created_permission.get("type", ""),
-        role=created_permission.get("role", ""),
-        email_address=created_permission.get("emailAddress"),
-        domain=created_permission.get("domain"),
-        expiration_time=created_permission.get("expirationTime"),
-    )
+    permission = _drive_permission(created_permission)
     result = DriveShareResult(
         file_id=file_id,
         file_name=file_metadata.get("name", "Unknown"),
@@ -1813,14 +1798,7 @@ async def batch_share_drive_file(
                 service.permissions().create(**create_params).execute
             )
             text_results.append(f"  - {format_permission_info(created_permission)}")
-            perm = DrivePermission(
-                id=created_permission.get("id", ""),
-                type=created_permission.get("type", ""),
-                role=created_permission.get("role", ""),
-                email_address=created_permission.get("emailAddress"),
-                domain=created_permission.get("domain"),
-                expiration_time=created_permission.get("expirationTime"),
-            )
+            perm = _drive_permission(created_permission)
             structured_results.append(
                 DriveBatchShareResultItem(
                     identifier=identifier, success=True, permission=perm
@@ -1942,14 +1920,7 @@ async def update_drive_permission(
     ]
 
     text_output = "\n".join(output_parts)
-    permission = DrivePermission(
-        id=updated_permission.get("id", ""),
-        type=updated_permission.get("type", ""),
-        role=updated_permission.get("role", ""),
-        email_address=updated_permission.get("emailAddress"),
-        domain=updated_permission.get("domain"),
-        expiration_time=updated_permission.get("expirationTime"),
-    )
+    permission = _drive_permission(updated_permission)
     result = DrivePermissionUpdateResult(
         file_id=file_id,
         file_name=file_metadata.get("name", "Unknown"),
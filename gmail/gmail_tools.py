@@ -22,7 +22,7 @@ from email.utils import formataddr
 from fastapi import Body
 from pydantic import Field
 
-from auth.service_decorator import require_google_service
+from auth.service_decorator import create_batch, require_google_service
 from core.utils import handle_http_errors
 from core.server import server
 from fastmcp.tools.tool import ToolResult
@@ -736,7 +736,7 @@ async def get_gmail_messages_content_batch(
 
         # Try to use batch API
         try:
-            batch = service.new_batch_http_request(callback=_batch_callback)
+            batch = create_batch(service, callback=_batch_callback)
 
             for mid in chunk_ids:
                 if format == "metadata":
@@ -1507,7 +1507,7 @@ async def get_gmail_threads_content_batch(
 
         # Try to use batch API
         try:
-            batch = service.new_batch_http_request(callback=_batch_callback)
+            batch = create_batch(service, callback=_batch_callback)
 
             for tid in chunk_ids:
                 req = service.users().threads().get(userId="me", id=tid, format="full")
@@ -0,0 +1,40 @@
+"""
+Bake the Apps Script output schemas into gappsscript/_schemas.json.
+
+The schemas are static, so they are generated once here instead of running
+pydantic schema generation for every model at import time. Re-run this
+script whenever a model in gappsscript/apps_script_models.py changes:
+
+    uv run python scripts/bake_schemas.py
+"""
+
+import json
+import os
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+
+from core.structured_output import generate_schema  # noqa: E402
+from gappsscript import apps_script_models  # noqa: E402
+
+SCHEMAS_PATH = os.path.join(ROOT, "gappsscript", "_schemas.json")
+
+
+def bake() -> dict:
+    """Generate the schema of every result model listed in SCHEMA_MODELS."""
+    return {
+        name: generate_schema(getattr(apps_script_models, name))
+        for name in apps_script_models.SCHEMA_MODELS
+    }
+
+
+def main() -> None:
+    with open(SCHEMAS_PATH, "w", encoding="utf-8") as f:
+        json.dump(bake(), f, indent=2)
+        f.write("\n")
+    print(f"Wrote {SCHEMAS_PATH}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Unit tests for the built service client cache in auth.google_auth.
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from google.oauth2.credentials import Credentials
+from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
+
+from auth import google_auth
+from auth.google_auth import build_cached_service, clear_service_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    clear_service_cache()
+    yield
+    clear_service_cache()
+
+
+def test_cached_service_reused_for_same_credentials_and_scopes():
+    """A second build with an equal token and scope set is served from cache."""
+    first = build_cached_service("drive", "v3", Credentials(token="abc"), ["s1"])
+    second = build_cached_service("drive", "v3", Credentials(token="abc"), ["s1"])
+
+    assert first is second
+
+
+def test_cached_service_keyed_on_exact_scope_set():
+    """A client built for one scope set is never returned for another."""
+    credentials = Credentials(token="abc")
+    broad = build_cached_service("drive", "v3", credentials, ["s1", "s2"])
+    narrow = build_cached_service("drive", "v3", credentials, ["s1"])
+
+    assert broad is not narrow
+
+
+def test_cached_service_keyed_on_token():
+    """Refreshed or different credentials always get a new client."""
+    first = build_cached_service("drive", "v3", Credentials(token="abc"), ["s1"])
+    second = build_cached_service("drive", "v3", Credentials(token="def"), ["s1"])
+
+    assert first is not second
+
+
+def test_cached_service_expires_after_ttl(monkeypatch):
+    """Entries older than the TTL are rebuilt."""
+    credentials = Credentials(token="abc")
+    first = build_cached_service("drive", "v3", credentials, ["s1"])
+
+    monkeypatch.setattr(google_auth, "_SERVICE_CACHE_TTL", 0)
+    second = build_cached_service("drive", "v3", credentials, ["s1"])
+
+    assert first is not second
+
+
+def test_requests_get_their_own_default_http():
+    """Each request, cached client or not, sends on a fresh build_http() Http."""
+    cached = build_cached_service("drive", "v3", Credentials(token="abc"), ["s1"])
+    uncached = build_cached_service("drive", "v3", Credentials(token=None), ["s1"])
+
+    assert google_auth._SERVICE_CACHE.keys() == {
+        google_auth._service_cache_key(
+            "drive", "v3", Credentials(token="abc"), ["s1"], None
+        )
+    }
+    for service in (cached, uncached):
+        first = service.files().list().http.http
+        second = service.files().list().http.http
+        assert first is not second
+        assert first.timeout == DEFAULT_HTTP_TIMEOUT_SEC
+        assert 308 not in first.redirect_codes
+
+
+def test_execute_reuses_thread_http(monkeypatch):
+    """execute() sends on one pooled Http per thread, not request.http."""
+    service = build_cached_service("drive", "v3", Credentials(token="abc"), ["s1"])
+    used = []
+
+    def _fake_execute(self, http=None, num_retries=0):
+        used.append(http.http)
+        return {}
+
+    monkeypatch.setattr(google_auth.HttpRequest, "execute", _fake_execute)
+    service.files().list().execute()
+    service.files().list().execute()
+    other = []
+    worker = threading.Thread(target=lambda: other.append(google_auth._thread_http()))
+    worker.start()
+    worker.join()
+
+    assert used[0] is used[1]
+    assert used[0] is google_auth._thread_http()
+    assert other[0] is not used[0]
@@ -0,0 +1,187 @@
+"""
+Unit tests for the Google service injection decorators.
+
+Authentication is mocked; these tests cover decoration-time behaviour.
+"""
+
+import inspect
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from google.auth.exceptions import RefreshError
+
+from auth import service_decorator
+from auth.google_auth import GoogleAuthenticationError
+from auth.scopes import DOCS_READONLY_SCOPE, DRIVE_READONLY_SCOPE
+from auth.service_decorator import (
+    TokenRefreshRequired,
+    require_google_service,
+    require_multiple_services,
+)
+
+
+def test_require_google_service_resolves_scopes_at_decoration():
+    """Scope group names are resolved once and attached to the wrapper."""
+
+    @require_google_service("drive", "drive_read")
+    async def tool(service, user_google_email: str, query: str):
+        return query
+
+    assert list(tool._required_google_scopes) == [DRIVE_READONLY_SCOPE]
+
+
+def test_decorated_tools_stay_coroutine_functions():
+    """Wrappers are native coroutines; sync tools are rejected at decoration."""
+
+    @require_google_service("drive", "drive_read")
+    async def tool(service, query: str):
+        return query
+
+    assert inspect.iscoroutinefunction(tool)
+    assert inspect.iscoroutinefunction(_multi_service_tool())
+
+    with pytest.raises(TypeError, match="must be an async function"):
+
+        @require_google_service("drive", "drive_read")
+        def sync_tool(service, query: str):
+            return query
+
+
+def test_require_google_service_unknown_service_fails_fast():
+    """An unknown service type is rejected when the tool is defined."""
+    with pytest.raises(ValueError, match="Unknown service type"):
+
+        @require_google_service("not_a_service", "drive_read")
+        async def tool(service, query: str):
+            return query
+
+
+def test_require_multiple_services_collects_scopes():
+    """All configured services contribute scopes and are hidden from the signature."""
+
+    @require_multiple_services(
+        [
+            {
+                "service_type": "drive",
+                "scopes": "drive_read",
+                "param_name": "drive_service",
+            },
+            {
+                "service_type": "docs",
+                "scopes": "docs_read",
+                "param_name": "docs_service",
+            },
+        ]
+    )
+    async def tool(drive_service, docs_service, document_id: str):
+        return document_id
+
+    assert list(tool._required_google_scopes) == [
+        DRIVE_READONLY_SCOPE,
+        DOCS_READONLY_SCOPE,
+    ]
+    assert list(inspect.signature(tool).parameters) == ["document_id"]
+
+
+def _multi_service_tool():
+    @require_multiple_services(
+        [
+            {
+                "service_type": "drive",
+                "scopes": "drive_read",
+                "param_name": "drive_service",
+            },
+            {
+                "service_type": "docs",
+                "scopes": "docs_read",
+                "param_name": "docs_service",
+            },
+        ]
+    )
+    async def tool(drive_service, docs_service, document_id: str):
+        return drive_service, docs_service, document_id
+
+    return tool
+
+
+@pytest.mark.asyncio
+async def test_require_multiple_services_injects_all_services(monkeypatch):
+    """Every configured service is authenticated and injected by name."""
+
+    async def fake_authenticate(use_oauth21, service_name, *args):
+        return f"{service_name}-client", "user@example.com"
+
+    monkeypatch.setattr(
+        service_decorator,
+        "_get_auth_context",
+        lambda tool_name: ("user@example.com", "oauth", None),
+    )
+    monkeypatch.setattr(service_decorator, "_authenticate_service", fake_authenticate)
+
+    result = await _multi_service_tool()(document_id="doc1")
+
+    assert result == ("drive-client", "docs-client", "doc1")
+
+
+@pytest.mark.asyncio
+async def test_require_multiple_services_reraises_auth_error(monkeypatch):
+    """A failure authenticating any service propagates unchanged."""
+    error = GoogleAuthenticationError("docs denied")
+
+    async def fake_authenticate(use_oauth21, service_name, *args):
+        if service_name == "docs":
+            raise error
+        return f"{service_name}-client", "user@example.com"
+
+    monkeypatch.setattr(
+        service_decorator,
+        "_get_auth_context",
+        lambda tool_name: ("user@example.com", "oauth", None),
+    )
+    monkeypatch.setattr(service_decorator, "_authenticate_service", fake_authenticate)
+
+    with pytest.raises(GoogleAuthenticationError) as exc_info:
+        await _multi_service_tool()(document_id="doc1")
+
+    assert exc_info.value is error
+
+
+@pytest.mark.asyncio
+async def test_require_multiple_services_wraps_refresh_error(monkeypatch):
+    """A RefreshError from the tool becomes TokenRefreshRequired."""
+
+    async def fake_authenticate(use_oauth21, service_name, *args):
+        return f"{service_name}-client", "user@example.com"
+
+    @require_multiple_services(
+        [{"service_type": "drive", "scopes": "drive_read", "param_name": "drive"}]
+    )
+    async def tool(drive):
+        raise RefreshError("invalid_grant: Token has been expired or revoked.")
+
+    monkeypatch.setattr(
+        service_decorator,
+        "_get_auth_context",
+        lambda tool_name: ("user@example.com", "oauth", None),
+    )
+    monkeypatch.setattr(service_decorator, "_authenticate_service", fake_authenticate)
+
+    with pytest.raises(TokenRefreshRequired) as exc_info:
+        await tool()
+
+    assert exc_info.value.user_email == "user@example.com"
+    assert "Token Expired/Revoked" in str(exc_info.value)
+
+
+def test_resolve_scopes_passes_through_unknown_names():
+    """Group names map to URLs; anything else is treated as a literal scope."""
+    custom = "https://example.com/custom.scope"
+
+    assert service_decorator._resolve_scopes("drive_read") == [DRIVE_READONLY_SCOPE]
+    assert service_decorator._resolve_scopes(["docs_read", custom]) == [
+        DOCS_READONLY_SCOPE,
+        custom,
+    ]
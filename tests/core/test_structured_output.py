@@ -0,0 +1,91 @@
+"""
+Unit tests for core.structured_output schema and result helpers.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from pydantic import TypeAdapter
+
+from core.structured_output import (
+    _dataclass_schema,
+    _normalize_schema,
+    create_tool_result,
+    fast_dict,
+    generate_schema,
+)
+
+
+@dataclass
+class Node:
+    name: str
+    children: list["Node"] = field(default_factory=list)
+
+
+@dataclass
+class Tree:
+    root: Node
+
+
+@fast_dict
+@dataclass
+class Item:
+    id: str
+    note: Optional[str] = None
+
+
+@fast_dict
+@dataclass
+class Listing:
+    items: list[Item]
+    extra: Any = None
+    next_page_token: Optional[str] = None
+
+
+def test_generate_schema_keeps_refs_only_for_recursive_models():
+    """Recursive models keep a $ref into $defs instead of recursing forever."""
+    schema = generate_schema(Tree)
+
+    root = schema["properties"]["root"]
+    assert root["type"] == "object"
+    assert root["properties"]["children"]["items"] == {"$ref": "#/$defs/Node"}
+    assert set(schema["$defs"]) == {"Node"}
+
+
+def test_generate_schema_inlines_nested_models_and_strips_any_of():
+    """Non-recursive nested models are inlined and nullable anyOf collapsed."""
+    schema = generate_schema(Listing)
+
+    assert "$defs" not in schema
+    item = schema["properties"]["items"]["items"]
+    assert item["properties"]["note"]["type"] == "string"
+    assert "anyOf" not in item["properties"]["note"]
+
+
+def test_dataclass_schema_matches_type_adapter():
+    """The direct field walk produces exactly the TypeAdapter-based schema."""
+    expected = _normalize_schema(TypeAdapter(Listing).json_schema())
+
+    assert _dataclass_schema(Listing) == expected
+    assert list(_dataclass_schema(Listing)["properties"]["items"]) == list(
+        expected["properties"]["items"]
+    )
+
+
+def test_fast_dict_matches_generic_conversion():
+    """Generated _to_dict drops None fields like the generic walk."""
+    listing = Listing(
+        items=[Item(id="a"), Item(id="b", note="n")],
+        extra={"keep": 1, "drop": None},
+    )
+
+    result = create_tool_result(text="ok", data=listing)
+
+    assert result.structured_content == {
+        "items": [{"id": "a"}, {"id": "b", "note": "n"}],
+        "extra": {"keep": 1},
+    }
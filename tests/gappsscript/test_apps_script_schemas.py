@@ -0,0 +1,20 @@
+"""
+Checks that the baked Apps Script schemas match the current models.
+
+If this fails, re-run scripts/bake_schemas.py and commit the result.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from core.structured_output import generate_schema
+from gappsscript import apps_script_models
+
+
+def test_baked_schemas_match_models():
+    """Every baked schema equals a freshly generated one."""
+    for name in apps_script_models.SCHEMA_MODELS:
+        model = getattr(apps_script_models, name)
+        assert apps_script_models._load_schemas()[name] == generate_schema(model), name
@@ -6,6 +6,7 @@ Tests all Apps Script tools with mocked API responses
 
 import pytest
 from unittest.mock import Mock
+from googleapiclient.errors import HttpError
 import sys
 import os
 
@@ -13,8 +14,11 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../.
 
 # Import the internal implementation functions (not the decorated ones)
 from gappsscript.apps_script_tools import (
+    clear_project_cache,
+    _collection,
     _list_script_projects_impl,
     _get_script_project_impl,
+    _get_script_content_impl,
     _create_script_project_impl,
     _update_script_content_impl,
     _run_script_function_impl,
@@ -27,11 +31,31 @@ from gappsscript.apps_script_tools import (
     _list_versions_impl,
     _create_version_impl,
     _get_version_impl,
+    _get_versions_impl,
     _get_script_metrics_impl,
     _generate_trigger_code_impl,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_project_cache():
+    clear_project_cache()
+    yield
+    clear_project_cache()
+
+
+def test_collection_built_once_per_service():
+    """Test that discovery collections are reused for the same service"""
+    mock_service = Mock()
+
+    first = _collection(mock_service, "projects.versions")
+    second = _collection(mock_service, "projects.versions")
+
+    assert first is second
+    assert mock_service.projects.call_count == 1
+    assert _collection(Mock(), "projects.versions") is not first
+
+
 @pytest.mark.asyncio
 async def test_list_script_projects():
     """Test listing Apps Script projects via Drive API"""
@@ -68,6 +92,8 @@ async def test_get_script_project():
         "creator": {"email": "creator@example.com"},
         "createTime": "2025-01-10T10:00:00Z",
         "updateTime": "2026-01-12T15:30:00Z",
+    }
+    mock_content = {
         "files": [
             {
                 "name": "Code",
@@ -78,6 +104,7 @@ async def test_get_script_project():
     }
 
     mock_service.projects().get().execute.return_value = mock_response
+    mock_service.projects().getContent().execute.return_value = mock_content
 
     text, structured = await _get_script_project_impl(
         service=mock_service, user_google_email="test@example.com", script_id="test123"
@@ -87,6 +114,57 @@ async def test_get_script_project():
     assert "creator@example.com" in text
     assert "Code" in text
 
+    text, structured = await _get_script_project_impl(
+        service=mock_service,
+        user_google_email="test@example.com",
+        script_id="test123",
+        include_source_preview=True,
+    )
+
+    assert "return 'hello'" in text
+    assert structured.files[0].source_preview is not None
+
+
+@pytest.mark.asyncio
+async def test_project_cache_reused_until_update():
+    """Repeated reads reuse the fetched project until it is updated"""
+    mock_service = Mock()
+    mock_service.projects().get().execute.return_value = {"scriptId": "test123"}
+    mock_service.projects().getContent().execute.return_value = {
+        "files": [{"name": "Code", "type": "SERVER_JS", "source": "v1"}],
+    }
+    mock_service.projects().updateContent().execute.return_value = {"files": []}
+    mock_service.projects().getContent().execute.reset_mock()
+
+    await _get_script_project_impl(
+        service=mock_service,
+        user_google_email="test@example.com",
+        script_id="test123",
+        include_source_preview=True,
+    )
+    text, _ = await _get_script_content_impl(
+        service=mock_service,
+        user_google_email="test@example.com",
+        script_id="test123",
+        file_name="Code",
+    )
+    assert "v1" in text
+    assert mock_service.projects().getContent().execute.call_count == 1
+
+    await _update_script_content_impl(
+        service=mock_service,
+        user_google_email="test@example.com",
+        script_id="test123",
+        files=[],
+    )
+    await _get_script_content_impl(
+        service=mock_service,
+        user_google_email="test@example.com",
+        script_id="test123",
+        file_name="Code",
+    )
+    assert mock_service.projects().getContent().execute.call_count == 2
+
 
 @pytest.mark.asyncio
 async def test_create_script_project():
@@ -354,6 +432,65 @@ async def test_get_version():
     assert "Bug fix" in text
 
 
+@pytest.mark.asyncio
+async def test_get_versions():
+    """Test getting several versions, reporting the ones that fail"""
+    mock_service = Mock()
+    responses = {
+        1: {"versionNumber": 1, "description": "First", "createTime": "2026-01-01"},
+        2: HttpError(Mock(status=404), b"Not found"),
+    }
+    mock_service.projects().versions().get.side_effect = (
+        lambda scriptId, versionNumber: Mock(
+            execute=Mock(side_effect=[responses[versionNumber]])
+        )
+    )
+
+    text, structured = await _get_versions_impl(
+        service=mock_service,
+        user_google_email="test@example.com",
+        script_id="test123",
+        version_numbers=[1, 2],
+    )
+
+    assert "Version 1 of script: test123" in text
+    assert "First" in text
+    assert structured.total_found == 1
+    assert structured.failed_versions == [2]
+
+
+@pytest.mark.asyncio
+async def test_get_versions_fetches_all_when_omitted():
+    """Test that every listed version is fetched, across pages"""
+    mock_service = Mock()
+    mock_service.projects().versions().list().execute.side_effect = [
+        {"versions": [{"versionNumber": 1}], "nextPageToken": "p2"},
+        {"versions": [{"versionNumber": 2}]},
+    ]
+    responses = {
+        1: {"versionNumber": 1, "description": "First"},
+        2: {"versionNumber": 2, "description": "Second"},
+    }
+    mock_service.projects().versions().get.side_effect = (
+        lambda scriptId, versionNumber: Mock(
+            execute=Mock(return_value=responses[versionNumber])
+        )
+    )
+
+    text, structured = await _get_versions_impl(
+        service=mock_service,
+        user_google_email="test@example.com",
+        script_id="test123",
+    )
+
+    assert "First" in text and "Second" in text
+    assert structured.total_found == 2
+    assert structured.failed_versions == []
+    mock_service.projects().versions().list.assert_called_with(
+        scriptId="test123", pageToken="p2"
+    )
+
+
 @pytest.mark.asyncio
 async def test_get_script_metrics():
     """Test getting script metrics"""
@@ -385,6 +522,8 @@ async def test_get_script_metrics():
     assert "100 executions" in text
     assert "Failed Executions" in text
     assert "5 failures" in text
+    assert structured.active_users.values == ["10"]
+    assert structured.failed_executions.start_times == ["2026-01-01"]
 
 
 def test_generate_trigger_code_daily():
@@ -0,0 +1,88 @@
+"""
+Unit tests for Google Chat MCP tools
+
+Tests the spaces listing cache and batched search with mocked API responses
+"""
+
+import pytest
+from unittest.mock import Mock
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+from googleapiclient.errors import HttpError
+
+from gchat import chat_tools
+from gchat.chat_tools import _list_spaces_cached, _search_spaces, clear_spaces_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_spaces_cache():
+    clear_spaces_cache()
+    yield
+    clear_spaces_cache()
+
+
+@pytest.mark.asyncio
+async def test_spaces_listing_reused_within_ttl(monkeypatch):
+    """Test that a spaces.list response is fetched once per service and parameters"""
+    mock_service = Mock()
+    mock_service.spaces().list().execute.return_value = {
+        "spaces": [{"name": "spaces/a", "displayName": "A"}]
+    }
+
+    first = await _list_spaces_cached(mock_service, {"pageSize": 100})
+    second = await _list_spaces_cached(mock_service, {"pageSize": 100})
+    await _list_spaces_cached(mock_service, {"pageSize": 100, "filter": "x"})
+
+    assert first is second
+    assert mock_service.spaces().list().execute.call_count == 2
+
+    monkeypatch.setattr(chat_tools, "_SPACES_CACHE_TTL", 0)
+    await _list_spaces_cached(mock_service, {"pageSize": 100})
+
+    assert mock_service.spaces().list().execute.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_search_spaces_retries_failed_batch_parts():
+    """Test that only missing or 429/5xx batch parts are searched again"""
+    mock_service = Mock()
+    requests = {}
+    forbidden = HttpError(Mock(status=403), b"forbidden")
+
+    def _list(parent, pageSize, filter):
+        request = Mock()
+        request.execute.return_value = {"messages": [{"text": parent}]}
+        requests[parent] = request
+        return request
+
+    mock_service.spaces().messages().list.side_effect = _list
+
+    def _new_batch(callback):
+        batch = Mock()
+
+        def _execute():
+            callback("0", {"messages": []}, None)
+            callback("1", None, HttpError(Mock(status=500), b"backend error"))
+            callback("2", None, forbidden)
+            # No callback for "3"
+
+        batch.execute.side_effect = _execute
+        return batch
+
+    mock_service.new_batch_http_request.side_effect = _new_batch
+
+    spaces = [{"name": f"spaces/{name}"} for name in "abcd"]
+    results = await _search_spaces(mock_service, spaces, "hi")
+
+    assert results == [
+        {"messages": []},
+        {"messages": [{"text": "spaces/b"}]},
+        forbidden,
+        {"messages": [{"text": "spaces/d"}]},
+    ]
+    requests["spaces/b"].execute.assert_called_once()
+    requests["spaces/c"].execute.assert_not_called()
+    requests["spaces/d"].execute.assert_called_once()